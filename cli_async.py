@@ -8,7 +8,6 @@ import argparse
 import sys
 import asyncio
 from pathlib import Path
-from tabulate import tabulate
 import time
 from typing import Optional
 
@@ -23,11 +22,43 @@ from src.data_fetchers import NSEDataFetcher
 logger = setup_logger("cli_async", log_file="logs/cli_async.log", level="INFO")
 
 
+BANNER = "=" * 80
+DIVIDER = "-" * 80
+
+# Single-stock report layout: (section title, [(label, formatter(result)), ...])
+DELIVERY_SECTION = "📦 DELIVERY DATA"
+REPORT_SECTIONS = [
+    ("📊 BASIC INFORMATION", [
+        ("Sector", lambda r: r['Sector']),
+        ("Market Cap", lambda r: f"₹{r['Market_Cap_Cr']:.0f} Cr"),
+        ("Current Price", lambda r: f"₹{r['Price']:.2f}"),
+    ]),
+    ("📈 TECHNICAL ANALYSIS", [
+        ("EMA-44", lambda r: f"₹{r['EMA-44']:.2f}"),
+        ("Price vs EMA", lambda r: f"{r['Price_vs_EMA']} ({r['Price_Diff_%']:+.2f}%)"),
+        ("EMA Slope", lambda r: f"{r['EMA_Slope_%']:+.2f}%"),
+        ("Trend", lambda r: r['Trend']),
+    ]),
+    ("💼 FUNDAMENTAL ANALYSIS", [
+        ("P/E Ratio", lambda r: f"{r['P/E']:.2f}"),
+        ("ROE", lambda r: f"{r['ROE_%']:.2f}%"),
+        ("Debt/Equity", lambda r: f"{r['Debt/Equity']:.2f}"),
+    ]),
+    (DELIVERY_SECTION, [
+        ("Delivery %", lambda r: f"{r['Delivery_%']:.2f}%"),
+        ("Trend", lambda r: r['Delivery_Qty_Trend']),
+    ]),
+    ("🎯 SCORE BREAKDOWN", [
+        ("Technical Score", lambda r: f"{r['Tech_Score']:.2f}"),
+        ("Fundamental Score", lambda r: f"{r['Fund_Score']:.2f}"),
+        ("Delivery Score", lambda r: f"{r['Deliv_Score']:.2f}"),
+    ]),
+]
+
+
 def print_header(text: str):
     """Print formatted header"""
-    print("\n" + "=" * 80)
-    print(f"  {text}")
-    print("=" * 80)
+    print(f"\n{BANNER}\n  {text}\n{BANNER}")
 
 
 def print_performance_stats(start_time: float, total_stocks: int):
@@ -41,124 +72,113 @@ def print_performance_stats(start_time: float, total_stocks: int):
     print(f"Average time per stock: {elapsed/total_stocks:.3f}s" if total_stocks > 0 else "")
 
 
-async def analyze_single_stock_async(symbol: str, use_delivery: bool = True):
+async def analyze_single_stock_async(symbol: str, use_delivery: bool = True, technical_only: bool = False):
     """Analyze a single stock using async pipeline"""
     print(f"\n🔍 Analyzing {symbol} (async mode)...\n")
     
     start_time = time.time()
-    pipeline = AsyncStockDataPipeline(max_workers=1, use_delivery=use_delivery)
+    async with AsyncStockDataPipeline(max_workers=1, use_delivery=use_delivery, technical_only=technical_only) as pipeline:
+        result = await pipeline._analyze_stock_async(symbol)
+        
+        if result:
+            # Print detailed analysis
+            print_header(f"📈 Analysis for {result['Symbol']} - {result['Company']}")
+            
+            for title, rows in REPORT_SECTIONS:
+                if title == DELIVERY_SECTION and result['Delivery_%'] <= 0:
+                    continue
+                
+                print(f"\n{title}")
+                print(DIVIDER)
+                print("\n".join(f"{label}: {fmt(result)}" for label, fmt in rows))
+            
+            print_header("🎯 FINAL VERDICT")
+            signal_emoji = pipeline.scorer.get_signal_emoji(result['Signal'])
+            print(f"\n{signal_emoji} Signal: {result['Signal']}")
+            print(f"Score: {result['Score']:.2f} / 5.0")
+            print(BANNER + "\n")
+            
+            print_performance_stats(start_time, 1)
+        else:
+            print(f"❌ Failed to analyze {symbol}")
+
+
+async def scan_all_stocks_async(
+    top_n: int = 30,
+    use_delivery: bool = True,
+    limit: Optional[int] = None,
+    compact: bool = False,
+    technical_only: bool = False
+):
+    """Scan all NSE stocks using async pipeline (compact=True skips tabulate's grid layout)"""
+    print(f"\n🚀 Scanning stocks with ASYNC pipeline (10-20x faster)...\n")
     
-    result = await pipeline._analyze_stock_async(symbol)
+    start_time = time.time()
     
-    if result:
-        # Print detailed analysis
-        print_header(f"📈 Analysis for {result['Symbol']} - {result['Company']}")
+    async with AsyncStockDataPipeline(max_workers=50, use_delivery=use_delivery, technical_only=technical_only) as pipeline:
+        # Optionally warmup delivery cache for massive speedup
+        if use_delivery and pipeline.delivery_fetcher:
+            print("🔥 Warming up delivery data cache (90 days for smart money detection)...")
+            warmup_start = time.time()
+            cached = pipeline.delivery_fetcher.warmup_cache(days=90, max_workers=10)
+            print(f"✓ Cache warmed up in {time.time() - warmup_start:.2f}s ({cached} files)\n")
         
-        print("\n📊 BASIC INFORMATION")
-        print("-" * 80)
-        print(f"Sector: {result['Sector']}")
-        print(f"Market Cap: ₹{result['Market_Cap_Cr']:.0f} Cr")
-        print(f"Current Price: ₹{result['Price']:.2f}")
+        df = await pipeline.fetch_all_data_async(limit=limit, progress=True)
         
-        print("\n📈 TECHNICAL ANALYSIS")
-        print("-" * 80)
-        print(f"EMA-44: ₹{result['EMA-44']:.2f}")
-        print(f"Price vs EMA: {result['Price_vs_EMA']} ({result['Price_Diff_%']:+.2f}%)")
-        print(f"EMA Slope: {result['EMA_Slope_%']:+.2f}%")
-        print(f"Trend: {result['Trend']}")
+        if df.empty:
+            print("❌ No data retrieved")
+            return
         
-        print("\n💼 FUNDAMENTAL ANALYSIS")
-        print("-" * 80)
-        print(f"P/E Ratio: {result['P/E']:.2f}")
-        print(f"ROE: {result['ROE_%']:.2f}%")
-        print(f"Debt/Equity: {result['Debt/Equity']:.2f}")
+        # Show top BUY signals - results are already sorted by score, so no re-sort
+        buys = pipeline.get_top_buys(top_n)
         
-        if result['Delivery_%'] > 0:
-            print("\n📦 DELIVERY DATA")
-            print("-" * 80)
-            print(f"Delivery %: {result['Delivery_%']:.2f}%")
-            print(f"Trend: {result['Delivery_Trend']}")
+        print_header(f"🚀 TOP {len(buys)} BUY SIGNALS (EMA Retracement + Smart Money)")
         
-        print("\n🎯 SCORE BREAKDOWN")
-        print("-" * 80)
-        print(f"Technical Score: {result['Tech_Score']:.2f}")
-        print(f"Fundamental Score: {result['Fund_Score']:.2f}")
-        print(f"Delivery Score: {result['Deliv_Score']:.2f}")
+        display_columns = [
+            'Symbol', 'Company', 'Daily_Diff_%', 'Weekly_Diff_%',
+            'Delivery_Qty_Spike', 'Has_Qty_Spike', 'Score', 'Signal'
+        ]
         
-        print_header("🎯 FINAL VERDICT")
-        signal_emoji = {'BUY': '🚀', 'HOLD': '⏸️', 'AVOID': '❌'}
-        print(f"\n{signal_emoji.get(result['Signal'], '❓')} Signal: {result['Signal']}")
-        print(f"Score: {result['Score']:.2f} / 5.0")
-        print("=" * 80 + "\n")
+        if compact:
+            # Plain pandas rendering - no per-cell grid drawing
+            print(buys[display_columns].to_string(index=False, float_format='{:.2f}'.format))
+        else:
+            from tabulate import tabulate  # lazy - not needed for --symbol or --compact
+            
+            print(tabulate(
+                buys[display_columns],
+                headers='keys',
+                tablefmt='grid',
+                floatfmt='.2f',
+                showindex=False
+            ))
         
-        print_performance_stats(start_time, 1)
-    else:
-        print(f"❌ Failed to analyze {symbol}")
-
-
-async def scan_all_stocks_async(top_n: int = 30, use_delivery: bool = True, limit: Optional[int] = None):
-    """Scan all NSE stocks using async pipeline"""
-    print(f"\n🚀 Scanning stocks with ASYNC pipeline (10-20x faster)...\n")
-    
-    start_time = time.time()
-    
-    pipeline = AsyncStockDataPipeline(max_workers=50, use_delivery=use_delivery)
-    
-    # Optionally warmup delivery cache for massive speedup
-    if use_delivery and pipeline.delivery_fetcher:
-        print("🔥 Warming up delivery data cache (90 days for smart money detection)...")
-        warmup_start = time.time()
-        cached = pipeline.delivery_fetcher.warmup_cache(days=90, max_workers=10)
-        print(f"✓ Cache warmed up in {time.time() - warmup_start:.2f}s ({cached} files)\n")
-    
-    df = await pipeline.fetch_all_data_async(limit=limit)
-    
-    if df.empty:
-        print("❌ No data retrieved")
-        return
-    
-    # Show top BUY signals (sorted by score)
-    buys = df[df['Signal'] == 'BUY'].nlargest(top_n, 'Score')
-    
-    print_header(f"🚀 TOP {len(buys)} BUY SIGNALS (EMA Retracement + Smart Money)")
-    
-    display_columns = [
-        'Symbol', 'Company', 'Daily_Diff_%', 'Weekly_Diff_%',
-        'Delivery_Qty_Spike', 'Has_Qty_Spike', 'Score', 'Signal'
-    ]
-    
-    print(tabulate(
-        buys[display_columns],
-        headers='keys',
-        tablefmt='grid',
-        floatfmt='.2f',
-        showindex=False
-    ))
-    
-    # Summary
-    summary = pipeline.get_summary()
-    print(f"\n📊 SUMMARY")
-    print(f"Total Analyzed: {summary['total_stocks']}")
-    print(f"🚀 BUY Signals: {summary['buy_signals']}")
-    print(f"⏸️ HOLD Signals: {summary['hold_signals']}")
-    print(f"❌ AVOID Signals: {summary['avoid_signals']}")
-    print(f"✗ Failed: {summary['failed_stocks']}")
-    print(f"⭐ Avg Score: {summary['avg_score']}")
-    
-    # Performance stats
-    print_performance_stats(start_time, summary['total_stocks'])
-    
-    # Export
-    print(f"\n💾 Exporting results...")
-    export_paths = await pipeline.export_async()
-    print(f"✓ CSV: {export_paths['csv']}")
-    print(f"✓ Excel: {export_paths['excel']}")
-    
-    # Cache stats
-    cache_stats = pipeline.get_cache_stats()
-    print(f"\n📊 CACHE STATS")
-    print(f"YFinance cached items: {cache_stats['yfinance']['total_items']}")
-    print(f"Results DataFrame cached: {cache_stats['results_cached']}")
+        # Summary
+        summary = pipeline.get_summary()
+        print(f"\n📊 SUMMARY")
+        print(f"Total Analyzed: {summary['total_stocks']}")
+        print(f"🚀 BUY Signals: {summary['buy_signals']}")
+        print(f"⏸️ HOLD Signals: {summary['hold_signals']}")
+        print(f"❌ AVOID Signals: {summary['avoid_signals']}")
+        print(f"✗ Failed: {summary['failed_stocks']}")
+        print(f"⭐ Avg Score: {summary['avg_score']}")
+        
+        # Performance stats
+        print_performance_stats(start_time, summary['total_stocks'])
+        
+        # Export
+        print(f"\n💾 Exporting results...")
+        export_paths = await pipeline.export_async()
+        print(f"✓ CSV: {export_paths['csv']}")
+        print(f"✓ Excel: {export_paths['excel']}")
+        if 'parquet' in export_paths:
+            print(f"✓ Parquet: {export_paths['parquet']}")
+        
+        # Cache stats
+        cache_stats = pipeline.get_cache_stats()
+        print(f"\n📊 CACHE STATS")
+        print(f"YFinance cached items: {cache_stats['yfinance']['total_items']}")
+        print(f"Results DataFrame cached: {cache_stats['results_cached']}")
 
 
 def main():
@@ -172,6 +192,8 @@ Examples:
   python cli_async.py --scan --top 30
   python cli_async.py --scan --limit 100 --no-delivery
   python cli_async.py --scan --top 50  # Full scan of 435+ stocks
+  python cli_async.py --scan --top 200 --compact
+  python cli_async.py --scan --technical-only
         """
     )
     
@@ -207,15 +229,27 @@ Examples:
         help='Skip delivery data fetching (faster)'
     )
     
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Print scan results as a plain table (faster for large --top)'
+    )
+    
+    parser.add_argument(
+        '--technical-only',
+        action='store_true',
+        help='Skip full fundamentals and score on technicals + delivery (faster)'
+    )
+    
     args = parser.parse_args()
     
     use_delivery = not args.no_delivery
     
     try:
         if args.symbol:
-            asyncio.run(analyze_single_stock_async(args.symbol, use_delivery))
+            asyncio.run(analyze_single_stock_async(args.symbol, use_delivery, args.technical_only))
         elif args.scan:
-            asyncio.run(scan_all_stocks_async(args.top, use_delivery, args.limit))
+            asyncio.run(scan_all_stocks_async(args.top, use_delivery, args.limit, args.compact, args.technical_only))
         else:
             parser.print_help()
     
@@ -0,0 +1,97 @@
+"""Numba EMA kernels - JIT-compiled EWMA for TechnicalAnalyzer"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # Closes from DataFrame.to_numpy() can be read-only views, which a
+    # mutable-array signature would reject
+    _CLOSES = types.Array(types.float64, 1, 'A', readonly=True)
+
+    # Explicit signatures compile eagerly at import (loaded from the on-disk
+    # cache after the first run): one specialization covers writable,
+    # read-only and strided closes, so no call pays compile time and no
+    # warmup call is needed
+    @njit(types.UniTuple(types.float64, 2)(_CLOSES, types.int64, types.int64), cache=True)
+    def _ema_last_and_lag(x, span, lag):
+        """
+        Single forward EMA pass returning only the values we need
+
+        Matches pandas `ewm(span=span, adjust=False).mean()` (including its
+        NaN handling with ignore_na=False) without materializing the series.
+
+        Args:
+            x: 1-D float array of closes
+            span: EMA span
+            lag: Bars back from the last value for the second result
+
+        Returns:
+            Tuple of (EMA at x[-1], EMA at x[-1 - lag])
+        """
+        alpha = 2.0 / (span + 1.0)
+        decay = 1.0 - alpha
+        lag_index = x.shape[0] - 1 - lag
+
+        weighted = np.nan
+        old_wt = 1.0
+        lagged = np.nan
+
+        for i in range(x.shape[0]):
+            cur = x[i]
+            if weighted != weighted:
+                # No observation yet - seed with the first valid value
+                if cur == cur:
+                    weighted = cur
+                    old_wt = 1.0
+            else:
+                old_wt *= decay
+                if cur == cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                    old_wt = 1.0
+            if i == lag_index:
+                lagged = weighted
+
+        return weighted, lagged
+
+    @njit(
+        # 'A' layout: a one-row or one-column panel is both C- and F-contiguous
+        # and numba types it as C, which a Fortran-only signature rejects
+        types.UniTuple(types.float64[:], 2)(types.Array(types.float64, 2, 'A'), types.int64, types.int64[:]),
+        cache=True, parallel=True
+    )
+    def _ema_panel_last_and_lag(panel, span, lags):
+        """
+        _ema_last_and_lag for every column of a (bars x symbols) panel
+        
+        Columns are independent, so they are spread across cores with
+        prange; pass a Fortran-ordered panel so each column is contiguous.
+        
+        Args:
+            panel: 2-D float array of closes, one column per symbol
+            span: EMA span
+            lags: Per-column bars back from the last value for the second result
+        
+        Returns:
+            Tuple of (last EMA per column, lagged EMA per column)
+        """
+        n_cols = panel.shape[1]
+        last = np.empty(n_cols)
+        lagged = np.empty(n_cols)
+        
+        for j in prange(n_cols):
+            end, start = _ema_last_and_lag(panel[:, j], span, lags[j])
+            last[j] = end
+            lagged[j] = start
+        
+        return last, lagged
+
+else:
+    _ema_last_and_lag = None
+    _ema_panel_last_and_lag = None
@@ -2,10 +2,17 @@
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 
+try:
+    from scipy.signal import lfilter
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 from ..utils.validators import validate_price
+from ._ema_numba import NUMBA_AVAILABLE, _ema_last_and_lag, _ema_panel_last_and_lag
 
 logger = logging.getLogger(__name__)
 
@@ -44,86 +51,296 @@ class TechnicalAnalyzer:
             return None
         
         try:
-            current_price = price_data['close'].iloc[-1]
+            current_price = price_data['close'].iat[-1]
             
             # 1. Daily Chart - 1 Year EMA (252 trading days)
-            daily_ema = self._calculate_ema_value(price_data, self.daily_ema_period)
-            daily_above = current_price > daily_ema if daily_ema else False
-            daily_diff_pct = ((current_price - daily_ema) / daily_ema * 100) if daily_ema else 0
+            # One EMA pass per timeframe yields both the value and the slope
+            daily_ema, daily_slope = self._calculate_ema_and_slope(price_data, self.daily_ema_period, 20)
             
             # 2. Weekly Chart - 5 Year EMA (convert daily to weekly)
-            weekly_data = self._resample_to_weekly(price_data)
-            weekly_ema = self._calculate_ema_value(weekly_data, self.weekly_ema_period)
-            weekly_above = current_price > weekly_ema if weekly_ema else False
-            weekly_diff_pct = ((current_price - weekly_ema) / weekly_ema * 100) if weekly_ema else 0
-            
-            # 3. Timeframe Alignment Score
-            alignment_score = 0
-            if daily_above:
-                alignment_score += 1
-            if weekly_above:
-                alignment_score += 1
-            
-            # 4. Trend Strength
-            if daily_above and weekly_above:
-                if daily_diff_pct > 5 and weekly_diff_pct > 5:
-                    trend_strength = 'VERY_STRONG'  # Both EMAs well above
-                else:
-                    trend_strength = 'STRONG'  # Both EMAs above
-            elif daily_above or weekly_above:
-                trend_strength = 'WEAK'  # Mixed signals
-            else:
-                trend_strength = 'DOWNTREND'  # Both EMAs below
-            
-            # 5. Calculate slopes for momentum
-            daily_slope = self._calculate_ema_slope(price_data, self.daily_ema_period, days=20)
-            weekly_slope = self._calculate_ema_slope(weekly_data, self.weekly_ema_period, weeks=4)
-            
-            # 6. Overall trend verdict
-            if daily_above and weekly_above and daily_slope > 0 and weekly_slope > 0:
-                overall_trend = 'STRONG_UPTREND'  # Perfect alignment
-            elif daily_above and weekly_above:
-                overall_trend = 'UPTREND'  # Good alignment
-            elif daily_above:
-                overall_trend = 'WEAK_UPTREND'  # Short-term only
+            # A single bar can't give a weekly EMA, so skip the resample for it
+            if len(price_data) < 2:
+                weekly_ema, weekly_slope = None, 0.0
             else:
-                overall_trend = 'DOWNTREND'
+                weekly_data = self._resample_to_weekly(price_data)
+                weekly_ema, weekly_slope = self._calculate_ema_and_slope(weekly_data, self.weekly_ema_period, 4)
             
-            return {
-                'current_price': round(current_price, 2),
-                
-                # Daily timeframe (1 year)
-                'daily_ema_252': round(daily_ema, 2) if daily_ema else 0,
-                'daily_vs_ema': 'ABOVE' if daily_above else 'BELOW',
-                'daily_diff_pct': round(daily_diff_pct, 2),
-                'daily_slope_pct': round(daily_slope, 2),
-                
-                # Weekly timeframe (5 years)
-                'weekly_ema_260': round(weekly_ema, 2) if weekly_ema else 0,
-                'weekly_vs_ema': 'ABOVE' if weekly_above else 'BELOW',
-                'weekly_diff_pct': round(weekly_diff_pct, 2),
-                'weekly_slope_pct': round(weekly_slope, 2),
-                
-                # Multi-timeframe verdict
-                'timeframe_alignment': alignment_score,  # 0, 1, or 2
-                'trend_strength': trend_strength,
-                'overall_trend': overall_trend,
-                
-                # Legacy compatibility
-                'ema': round(daily_ema, 2) if daily_ema else 0,
-                'price_vs_ema': 'ABOVE' if daily_above else 'BELOW',
-                'price_diff_pct': round(daily_diff_pct, 2),
-                'slope_pct': round(daily_slope, 2),
-                'slope_trend': 'RISING' if daily_slope > 2 else 'FALLING' if daily_slope < -2 else 'FLAT',
-                
-                'data_points': len(price_data),
-                'multi_timeframe': True
-            }
+            return self._build_result(
+                current_price, daily_ema, daily_slope, weekly_ema, weekly_slope, len(price_data)
+            )
         
         except Exception as e:
             logger.error(f"Error in technical analysis: {str(e)}")
             return None
     
+    def analyze_batch(self, price_data: Dict[str, pd.DataFrame]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Multi-timeframe EMA analysis for many symbols at once
+        
+        Daily and weekly closes are stacked into right-aligned 2D panels
+        (bars x symbols, NaN-padded at the top) so every symbol's EMAs come
+        from one parallel Numba pass (or one streamed NumPy pass) instead of
+        one call per symbol. Leading NaNs don't affect an adjust=False EMA,
+        so results match analyze().
+        
+        Args:
+            price_data: Mapping of symbol -> price DataFrame (must have 'close' column)
+        
+        Returns:
+            Mapping of symbol -> analysis results (None where analysis failed)
+        """
+        results = {symbol: None for symbol in price_data}
+        symbols = [
+            symbol for symbol, data in price_data.items()
+            if data is not None and not data.empty and 'close' in data.columns
+        ]
+        if not symbols:
+            return results
+        
+        try:
+            daily, daily_lengths = self._stack_closes(
+                [price_data[symbol]['close'] for symbol in symbols]
+            )
+            weekly, weekly_lengths = self._weekly_panel(price_data, symbols)
+            
+            daily_ema, daily_ok, daily_slope = self._panel_ema_and_slope(
+                daily, daily_lengths, self.daily_ema_period, 20
+            )
+            weekly_ema, weekly_ok, weekly_slope = self._panel_ema_and_slope(
+                weekly, weekly_lengths, self.weekly_ema_period, 4
+            )
+            
+            for j, symbol in enumerate(symbols):
+                results[symbol] = self._build_result(
+                    daily[-1, j],
+                    daily_ema[j] if daily_ok[j] else None, daily_slope[j],
+                    weekly_ema[j] if weekly_ok[j] else None, weekly_slope[j],
+                    int(daily_lengths[j])
+                )
+        
+        except Exception as e:
+            logger.error(f"Error in batch technical analysis: {str(e)}")
+        
+        return results
+    
+    def _build_result(
+        self,
+        current_price: float,
+        daily_ema: Optional[float],
+        daily_slope: float,
+        weekly_ema: Optional[float],
+        weekly_slope: float,
+        data_points: int
+    ) -> Dict[str, Any]:
+        """Derive trend verdicts from the EMA values and assemble the analysis dict"""
+        daily_above = current_price > daily_ema if daily_ema else False
+        daily_diff_pct = ((current_price - daily_ema) / daily_ema * 100) if daily_ema else 0
+        
+        weekly_above = current_price > weekly_ema if weekly_ema else False
+        weekly_diff_pct = ((current_price - weekly_ema) / weekly_ema * 100) if weekly_ema else 0
+        
+        # 3. Timeframe Alignment Score
+        alignment_score = 0
+        if daily_above:
+            alignment_score += 1
+        if weekly_above:
+            alignment_score += 1
+        
+        # 4. Trend Strength
+        if daily_above and weekly_above:
+            if daily_diff_pct > 5 and weekly_diff_pct > 5:
+                trend_strength = 'VERY_STRONG'  # Both EMAs well above
+            else:
+                trend_strength = 'STRONG'  # Both EMAs above
+        elif daily_above or weekly_above:
+            trend_strength = 'WEAK'  # Mixed signals
+        else:
+            trend_strength = 'DOWNTREND'  # Both EMAs below
+        
+        # 5. Overall trend verdict
+        if daily_above and weekly_above and daily_slope > 0 and weekly_slope > 0:
+            overall_trend = 'STRONG_UPTREND'  # Perfect alignment
+        elif daily_above and weekly_above:
+            overall_trend = 'UPTREND'  # Good alignment
+        elif daily_above:
+            overall_trend = 'WEAK_UPTREND'  # Short-term only
+        else:
+            overall_trend = 'DOWNTREND'
+        
+        # Round each value once; the legacy keys reuse the daily figures
+        daily_ema_r = round(daily_ema, 2) if daily_ema else 0
+        daily_diff_r = round(daily_diff_pct, 2)
+        daily_slope_r = round(daily_slope, 2)
+        daily_vs_ema = 'ABOVE' if daily_above else 'BELOW'
+        
+        return {
+            'current_price': round(current_price, 2),
+            
+            # Daily timeframe (1 year)
+            'daily_ema_252': daily_ema_r,
+            'daily_vs_ema': daily_vs_ema,
+            'daily_diff_pct': daily_diff_r,
+            'daily_slope_pct': daily_slope_r,
+            
+            # Weekly timeframe (5 years)
+            'weekly_ema_260': round(weekly_ema, 2) if weekly_ema else 0,
+            'weekly_vs_ema': 'ABOVE' if weekly_above else 'BELOW',
+            'weekly_diff_pct': round(weekly_diff_pct, 2),
+            'weekly_slope_pct': round(weekly_slope, 2),
+            
+            # Multi-timeframe verdict
+            'timeframe_alignment': alignment_score,  # 0, 1, or 2
+            'trend_strength': trend_strength,
+            'overall_trend': overall_trend,
+            
+            # Legacy compatibility
+            'ema': daily_ema_r,
+            'price_vs_ema': daily_vs_ema,
+            'price_diff_pct': daily_diff_r,
+            'slope_pct': daily_slope_r,
+            'slope_trend': 'RISING' if daily_slope > 2 else 'FALLING' if daily_slope < -2 else 'FLAT',
+            
+            'data_points': data_points,
+            'multi_timeframe': True
+        }
+    
+    @staticmethod
+    def _stack_closes(closes: List[pd.Series]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stack close series into a right-aligned (bars x symbols) float64 panel
+        
+        Shorter histories are NaN-padded at the top so the last row holds
+        every symbol's latest close.
+        
+        Returns:
+            Tuple of (panel, per-symbol lengths)
+        """
+        lengths = np.array([len(close) for close in closes], dtype=np.int64)
+        # Column-major so each symbol's history is contiguous for the EMA kernels
+        panel = np.full((max(int(lengths.max()), 1), len(closes)), np.nan, order='F')
+        for j, close in enumerate(closes):
+            if lengths[j]:
+                panel[-lengths[j]:, j] = close.to_numpy(dtype=np.float64)
+        return panel, lengths
+    
+    def _weekly_panel(
+        self,
+        price_data: Dict[str, pd.DataFrame],
+        symbols: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Right-aligned weekly close panel for many symbols
+        
+        When every symbol has unique dates, their closes are aligned on one
+        date index and resampled in a single call; each column's non-empty
+        weeks are then pushed to the bottom with a stable argsort. Otherwise
+        falls back to _resample_to_weekly per symbol.
+        
+        Returns:
+            Tuple of (panel, per-symbol lengths)
+        """
+        closes = {}
+        for symbol in symbols:
+            close = self._close_by_date(price_data[symbol])
+            if not isinstance(close.index, pd.DatetimeIndex) or not close.index.is_unique:
+                closes = None
+                break
+            closes[symbol] = close
+        
+        if closes:
+            try:
+                weekly = pd.concat(closes, axis=1).resample('W').last().to_numpy(dtype=np.float64)
+                
+                # Work symbol-major so the mask, argsort and gather run over
+                # contiguous histories; the transpose back is the Fortran panel
+                histories = np.ascontiguousarray(weekly.T)
+                
+                # Right-align each column: missing weeks (NaN) first, kept weeks in order below
+                present = ~np.isnan(histories)
+                order = np.argsort(present, axis=1, kind='stable')
+                panel = np.take_along_axis(histories, order, axis=1).T
+                return panel, present.sum(axis=1)
+            except Exception as e:
+                logger.debug(f"Batch weekly resample failed, resampling per symbol: {str(e)}")
+        
+        return self._stack_closes(
+            [self._resample_to_weekly(price_data[symbol])['close'] for symbol in symbols]
+        )
+    
+    def _panel_ema_and_slope(
+        self,
+        panel: np.ndarray,
+        lengths: np.ndarray,
+        period: int,
+        lookback: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-column _calculate_ema_and_slope over a right-aligned close panel
+        
+        Returns:
+            Tuple of (last EMA values, mask of columns with a usable EMA value
+            i.e. history >= period, slopes %)
+        """
+        lookbacks = np.clip(np.minimum(lookback, lengths), 1, None)
+        
+        # Neither path materializes the full EMA panel
+        if NUMBA_AVAILABLE:
+            # Kernel walks one column per thread - keep columns contiguous (no-op if already F)
+            ema_end, ema_start = _ema_panel_last_and_lag(np.asfortranarray(panel), period, lookbacks - 1)
+        else:
+            ema_end, ema_start = self._stream_panel_ema(panel, period, lookbacks - 1)
+        
+        enough = lengths >= 2
+        has_value = enough & (lengths >= period)
+        
+        # slope = (end - start) / start * 100 where start > 0, else 0 - computed in place
+        slopes = np.zeros(panel.shape[1])
+        valid = enough & (ema_start > 0)
+        np.subtract(ema_end, ema_start, out=slopes, where=valid)
+        np.divide(slopes, ema_start, out=slopes, where=valid)
+        slopes *= 100
+        
+        return ema_end, has_value, slopes
+    
+    @staticmethod
+    def _stream_panel_ema(panel: np.ndarray, span: int, lags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        NumPy fallback for _ema_panel_last_and_lag
+        
+        Streams the panel row by row carrying only the per-symbol EMA state
+        (same recurrence and NaN weighting as pandas ewm(adjust=False)), and
+        captures each column's lagged value as its row goes by.
+        
+        Returns:
+            Tuple of (last EMA per column, lagged EMA per column)
+        """
+        alpha = 2.0 / (span + 1.0)
+        decay = 1.0 - alpha
+        n_rows, n_cols = panel.shape
+        lag_rows = n_rows - 1 - lags
+        
+        weighted = np.full(n_cols, np.nan)
+        old_wt = np.ones(n_cols)
+        lagged = np.full(n_cols, np.nan)
+        
+        for i in range(n_rows):
+            row = panel[i]
+            seeded = ~np.isnan(weighted)
+            valid = ~np.isnan(row)
+            
+            # Seeded columns decay their weight every bar; new values blend in,
+            # unseeded columns take their first valid value as is
+            old_wt = np.where(seeded, old_wt * decay, old_wt)
+            blended = np.where(seeded, (old_wt * weighted + alpha * row) / (old_wt + alpha), row)
+            weighted = np.where(valid, blended, weighted)
+            old_wt = np.where(valid, 1.0, old_wt)
+            
+            capture = lag_rows == i
+            if capture.any():
+                lagged[capture] = weighted[capture]
+        
+        return weighted, lagged
+    
     def get_support_resistance(
         self, 
         price_data: pd.DataFrame,
@@ -143,26 +360,71 @@ class TechnicalAnalyzer:
             return {'support': 0, 'resistance': 0}
         
         try:
-            recent = price_data.tail(window)
+            # Bounded NumPy slices - no tail() frame copy or pandas reduction dispatch
+            lows = price_data['low'].to_numpy(dtype=np.float64)[-window:]
+            highs = price_data['high'].to_numpy(dtype=np.float64)[-window:]
             
             return {
-                'support': round(recent['low'].min(), 2),
-                'resistance': round(recent['high'].max(), 2),
-                'current': round(price_data['close'].iloc[-1], 2)
+                'support': round(np.nanmin(lows), 2),
+                'resistance': round(np.nanmax(highs), 2),
+                'current': round(price_data['close'].iat[-1], 2)
             }
             
         except Exception as e:
             logger.error(f"Error calculating support/resistance: {str(e)}")
             return {'support': 0, 'resistance': 0}
     
+    def _ema_last_and_lag(self, data: pd.DataFrame, period: int, lag: int = 0) -> Tuple[float, float]:
+        """
+        EMA of the close at the last bar and `lag` bars earlier
+        
+        Uses the Numba kernel when available (no intermediate Series),
+        otherwise scipy's lfilter (same recurrence, without pandas' ewm
+        dispatch) when the closes have no gaps, otherwise pandas ewm.
+        """
+        if NUMBA_AVAILABLE:
+            return _ema_last_and_lag(data['close'].to_numpy(dtype=np.float64), period, lag)
+        
+        if SCIPY_AVAILABLE:
+            closes = data['close'].to_numpy(dtype=np.float64)
+            # lfilter would carry a NaN forward; ewm skips it, so gaps stay on pandas
+            if not np.isnan(closes).any():
+                alpha = 2.0 / (period + 1.0)
+                # y[n] = alpha * x[n] + (1 - alpha) * y[n-1], seeded so y[0] = x[0]
+                ema, _ = lfilter([alpha], [1.0, alpha - 1.0], closes, zi=[closes[0] * (1.0 - alpha)])
+                return ema[-1], ema[-1 - lag]
+        
+        ema_series = data['close'].ewm(span=period, adjust=False).mean()
+        return ema_series.iat[-1], ema_series.iat[-1 - lag]
+    
+    def _calculate_ema_and_slope(self, data: pd.DataFrame, period: int, lookback: int) -> Tuple[Optional[float], float]:
+        """
+        EMA value and EMA slope (%) over `lookback` bars from a single pass
+        
+        The value is None when there are fewer than `period` bars; the slope
+        is computed regardless, as _calculate_ema_slope does.
+        """
+        if data is None or len(data) < 2:
+            return None, 0.0
+        
+        try:
+            lookback = min(lookback, len(data))
+            ema_end, ema_start = self._ema_last_and_lag(data, period, lookback - 1)
+            
+            ema_value = ema_end if len(data) >= period else None
+            slope_pct = ((ema_end - ema_start) / ema_start * 100) if ema_start > 0 else 0
+            return ema_value, slope_pct
+        except Exception as e:
+            logger.error(f"Error calculating EMA: {str(e)}")
+            return None, 0.0
+    
     def _calculate_ema_value(self, data: pd.DataFrame, period: int) -> Optional[float]:
         """Calculate single EMA value for given period"""
         if data is None or len(data) < period:
             return None
         
         try:
-            ema_series = data['close'].ewm(span=period, adjust=False).mean()
-            return ema_series.iloc[-1]
+            return self._ema_last_and_lag(data, period)[0]
         except Exception as e:
             logger.error(f"Error calculating EMA: {str(e)}")
             return None
@@ -170,18 +432,15 @@ class TechnicalAnalyzer:
     def _resample_to_weekly(self, daily_data: pd.DataFrame) -> pd.DataFrame:
         """Convert daily data to weekly for long-term analysis"""
         try:
-            # Ensure index is datetime
-            if 'date' in daily_data.columns:
-                weekly = daily_data.set_index('date')
-            else:
-                weekly = daily_data.copy()
-            
-            if not isinstance(weekly.index, pd.DatetimeIndex):
+            # Ensure index is datetime - only the close column is needed, so
+            # the rest of the frame is never re-indexed or copied
+            close = self._close_by_date(daily_data)
+            if not isinstance(close.index, pd.DatetimeIndex):
                 return daily_data  # Can't resample, return original
             
             # Resample to weekly (use last close of week)
             weekly_resampled = pd.DataFrame({
-                'close': weekly['close'].resample('W').last()
+                'close': close.resample('W').last()
             }).dropna()
             
             return weekly_resampled
@@ -189,21 +448,26 @@ class TechnicalAnalyzer:
             logger.debug(f"Could not resample to weekly: {str(e)}")
             return daily_data
     
+    @staticmethod
+    def _close_by_date(data: pd.DataFrame) -> pd.Series:
+        """Close series indexed by the 'date' column when present, else by the frame's index"""
+        close = data['close']
+        if 'date' in data.columns:
+            close = close.set_axis(pd.Index(data['date']))
+        return close
+    
     def _calculate_ema_slope(self, data: pd.DataFrame, ema_period: int, days: int = None, weeks: int = None) -> float:
         """Calculate EMA slope over specified period"""
         try:
-            ema_series = data['close'].ewm(span=ema_period, adjust=False).mean()
-            
-            if len(ema_series) < 2:
+            if len(data) < 2:
                 return 0.0
             
             # Use specified lookback period
             lookback = weeks if weeks else days if days else 5
-            if len(ema_series) < lookback:
-                lookback = len(ema_series)
+            if len(data) < lookback:
+                lookback = len(data)
             
-            ema_start = ema_series.iloc[-lookback]
-            ema_end = ema_series.iloc[-1]
+            ema_end, ema_start = self._ema_last_and_lag(data, ema_period, lookback - 1)
             
             slope_pct = ((ema_end - ema_start) / ema_start * 100) if ema_start > 0 else 0
             return slope_pct
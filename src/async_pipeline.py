@@ -2,21 +2,49 @@
 
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import asyncio
 import logging
 from datetime import datetime
 from functools import cached_property
 
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
 from .data_fetchers import NSEDataFetcher, AsyncYFinanceDataFetcher, DeliveryDataFetcher
 from .analyzers import TechnicalAnalyzer, FundamentalAnalyzer
 from .scorers import StockScorer
-from .exporters import CSVExporter, ExcelExporter
+from .scorers.stock_scorer import SCORE_COLUMNS
+from .exporters import CSVExporter, ExcelExporter, ParquetExporter
+from .exporters.parquet_exporter import PYARROW_AVAILABLE
 from .utils.logger import get_logger
 from .utils.validators import sanitize_symbol
 
 logger = get_logger(__name__)
 
+# Default for _analyze_stock_async(delivery=...): fetch it there (None is a valid result)
+_FETCH = object()
+
+# Low-cardinality label columns stored as categoricals (int codes + one
+# copy of each label) in the results DataFrame
+CATEGORY_COLUMNS = (
+    'Sector', 'Price_vs_EMA', 'Trend', 'Daily_vs_EMA', 'Weekly_vs_EMA',
+    'Trend_Strength', 'Delivery_Qty_Trend', 'Signal'
+)
+
+
+def _results_to_df(results: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Score-sorted results DataFrame, rounded for display/export"""
+    if not results:
+        return pd.DataFrame()
+    df = pd.DataFrame(results).sort_values('Score', ascending=False).reset_index(drop=True)
+    # Scores stay unrounded through scoring; round once here for display/export
+    df = df.round({col: 2 for col in SCORE_COLUMNS})
+    return df.astype({col: 'category' for col in CATEGORY_COLUMNS if col in df.columns})
+
 
 class AsyncStockDataPipeline:
     """High-performance async stock analysis pipeline - 10-20x faster than sync version"""
@@ -25,7 +53,8 @@ class AsyncStockDataPipeline:
         self,
         max_workers: int = 50,
         use_delivery: bool = True,
-        cache_ttl: int = 3600
+        cache_ttl: int = 3600,
+        technical_only: bool = False
     ):
         """
         Initialize async stock data pipeline
@@ -34,9 +63,12 @@ class AsyncStockDataPipeline:
             max_workers: Maximum concurrent tasks
             use_delivery: Whether to fetch delivery data
             cache_ttl: Cache time-to-live in seconds
+            technical_only: Skip full fundamentals (quote-only fetch, no
+                            fundamental score) - much faster per stock
         """
         self.max_workers = max_workers
         self.use_delivery = use_delivery
+        self.technical_only = technical_only
         
         # Initialize components
         self.nse_fetcher = NSEDataFetcher()
@@ -50,6 +82,7 @@ class AsyncStockDataPipeline:
         self.scorer = StockScorer()
         self.csv_exporter = CSVExporter()
         self.excel_exporter = ExcelExporter()
+        self.parquet_exporter = ParquetExporter()
         
         # Results storage
         self.results = []
@@ -60,9 +93,7 @@ class AsyncStockDataPipeline:
     @cached_property
     def results_df(self) -> pd.DataFrame:
         """Cached DataFrame - 5-10x faster than repeated conversions"""
-        if not self.results:
-            return pd.DataFrame()
-        return pd.DataFrame(self.results).sort_values('Score', ascending=False).reset_index(drop=True)
+        return _results_to_df(self.results)
     
     def _invalidate_cache(self):
         """Invalidate cached DataFrame"""
@@ -73,7 +104,8 @@ class AsyncStockDataPipeline:
         self,
         symbols: Optional[List[str]] = None,
         limit: Optional[int] = None,
-        save_steps: bool = True
+        save_steps: bool = True,
+        progress: bool = False
     ) -> pd.DataFrame:
         """
         Async fetch and analyze data for all stocks
@@ -82,6 +114,8 @@ class AsyncStockDataPipeline:
             symbols: List of symbols to analyze (fetches all if None)
             limit: Maximum number of stocks to process
             save_steps: Save intermediate CSV files after each step
+            progress: Show a tqdm progress bar (if installed) instead of
+                      logging every batch
         
         Returns:
             DataFrame with complete analysis
@@ -112,21 +146,60 @@ class AsyncStockDataPipeline:
         # STEP 2: Fetch and save raw data
         raw_data_list = []
         
+        # One throttled bar update per batch; per-batch log lines drop to debug under it
+        progress_bar = tqdm(total=len(symbols), desc='Analyzing', unit='stock') if progress and TQDM_AVAILABLE else None
+        log_batch = logger.debug if progress_bar is not None else logger.info
+        
         # Process stocks in batches
         batch_size = self.max_workers
-        for i in range(0, len(symbols), batch_size):
-            batch = symbols[i:i + batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}/{(len(symbols)-1)//batch_size + 1}")
-            
-            batch_results = await self._analyze_batch_async(batch, save_raw_data=save_steps)
-            
-            for symbol, result in zip(batch, batch_results):
-                if result:
-                    self.results.append(result)
-                    if save_steps and 'raw_data' in result:
-                        raw_data_list.append(result['raw_data'])
-                else:
-                    self.failed_symbols.append(symbol)
+        try:
+            for i in range(0, len(symbols), batch_size):
+                batch = symbols[i:i + batch_size]
+                log_batch(f"Processing batch {i//batch_size + 1}/{(len(symbols)-1)//batch_size + 1}")
+                
+                # One batched download for the whole batch's price history, then
+                # one stacked-panel technical pass over all of it
+                histories = await self.async_yf_fetcher.fetch_price_history_batch(batch, period=None)
+                technicals = self.technical_analyzer.analyze_batch(histories)
+                
+                # Delivery trends for the whole batch in one executor hop
+                deliveries = None
+                if self.use_delivery and self.delivery_fetcher:
+                    loop = asyncio.get_event_loop()
+                    try:
+                        deliveries = await loop.run_in_executor(
+                            None,
+                            self.delivery_fetcher.fetch_delivery_trends,
+                            batch,
+                            90,  # 90-day lookback for quantity spike detection
+                            2.0  # 2x baseline = spike threshold
+                        )
+                    except Exception as e:
+                        # Delivery data is optional - score this batch without it
+                        logger.error(f"Delivery trend fetch failed for batch: {str(e)}")
+                        deliveries = dict.fromkeys(batch)
+                
+                batch_results = await self._analyze_batch_async(
+                    batch,
+                    save_raw_data=save_steps,
+                    technicals=technicals,
+                    histories=histories,
+                    deliveries=deliveries
+                )
+                
+                for symbol, result in zip(batch, batch_results):
+                    if result:
+                        self.results.append(result)
+                        if save_steps and 'raw_data' in result:
+                            raw_data_list.append(result['raw_data'])
+                    else:
+                        self.failed_symbols.append(symbol)
+                
+                if progress_bar is not None:
+                    progress_bar.update(len(batch))
+        finally:
+            if progress_bar is not None:
+                progress_bar.close()
         
         # STEP 2: Save delivery data
         if save_steps and raw_data_list:
@@ -150,149 +223,278 @@ class AsyncStockDataPipeline:
         
         return self.results_df
     
-    async def _analyze_batch_async(self, symbols: List[str], save_raw_data: bool = False) -> List[Optional[Dict[str, Any]]]:
-        """Analyze a batch of stocks concurrently"""
-        tasks = [self._analyze_stock_async(symbol, save_raw_data=save_raw_data) for symbol in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def _analyze_batch_async(
+        self,
+        symbols: List[str],
+        save_raw_data: bool = False,
+        technicals: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+        histories: Optional[Dict[str, Optional[pd.DataFrame]]] = None,
+        deliveries: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze a batch of stocks concurrently, then score them in one score_batch pass
+        
+        technicals/histories/deliveries are the batch's precomputed analyze_batch
+        results, already-fetched price histories and fetch_delivery_trends
+        results, reused instead of refetched.
+        """
+        technicals = technicals or {}
+        histories = histories or {}
+        tasks = [
+            self._collect_stock_async(
+                symbol,
+                technical=technicals.get(symbol),
+                price_data=histories.get(symbol),
+                delivery=deliveries.get(symbol) if deliveries is not None else _FETCH
+            )
+            for symbol in symbols
+        ]
+        collected = await asyncio.gather(*tasks, return_exceptions=True)
+        collected = [item if not isinstance(item, Exception) else None for item in collected]
+        
+        # Score every analyzable stock in the batch in one pass
+        scored = [item for item in collected if item is not None]
+        score_results = iter(self._score_collected(scored))
+        
+        return [
+            self._compile_result(*item, next(score_results), save_raw_data) if item is not None else None
+            for item in collected
+        ]
+    
+    def _score_collected(self, collected: List[Tuple]) -> List[Dict[str, Any]]:
+        """
+        calculate_score-shaped results for _collect_stock_async outputs via score_batch
+        
+        Falls back to scoring stock by stock if the batch scorer fails.
+        """
+        if not collected:
+            return []
         
+        technicals = [item[2] for item in collected]
+        fundamentals = [item[3] for item in collected]
+        deliveries = [item[4] for item in collected]
+        try:
+            batch = self.scorer.score_batch(technicals, fundamentals, deliveries)
+        except Exception as e:
+            logger.error(f"Batch scoring failed, scoring per stock: {str(e)}")
+            return [
+                self.scorer.calculate_score(t, f, d)
+                for t, f, d in zip(technicals, fundamentals, deliveries)
+            ]
+        
+        breakdown = batch['breakdown']
         return [
-            result if not isinstance(result, Exception) else None
-            for result in results
+            {
+                'total_score': total,
+                'signal': signal,
+                'breakdown': {'technical': tech, 'fundamental': fund, 'delivery': deliv}
+            }
+            for total, signal, tech, fund, deliv in zip(
+                batch['total_score'].tolist(),
+                batch['signal'].tolist(),
+                breakdown['technical'].tolist(),
+                breakdown['fundamental'].tolist(),
+                breakdown['delivery'].tolist()
+            )
         ]
     
-    async def _analyze_stock_async(self, symbol: str, save_raw_data: bool = False) -> Optional[Dict[str, Any]]:
+    async def _analyze_stock_async(
+        self,
+        symbol: str,
+        save_raw_data: bool = False,
+        technical: Optional[Dict[str, Any]] = None,
+        price_data: Optional[pd.DataFrame] = None,
+        delivery: Any = _FETCH
+    ) -> Optional[Dict[str, Any]]:
         """
         Analyze a single stock asynchronously
         
         Args:
             symbol: Stock symbol
+            save_raw_data: Attach raw delivery data for step exports
+            technical: Precomputed technical analysis (computed here if None)
+            price_data: Price history already fetched for this symbol (fetched here if None)
+            delivery: Precomputed delivery trend (fetched here if omitted)
         
         Returns:
             Dictionary with complete analysis or None if failed
         """
+        collected = await self._collect_stock_async(symbol, technical, price_data, delivery)
+        if collected is None:
+            return None
+        
+        _, _, technical, fundamental, delivery = collected
+        score_result = self.scorer.calculate_score(
+            technical_analysis=technical,
+            fundamental_analysis=fundamental,
+            delivery_data=delivery
+        )
+        return self._compile_result(*collected, score_result, save_raw_data)
+    
+    async def _collect_stock_async(
+        self,
+        symbol: str,
+        technical: Optional[Dict[str, Any]] = None,
+        price_data: Optional[pd.DataFrame] = None,
+        delivery: Any = _FETCH
+    ) -> Optional[Tuple]:
+        """
+        Fetch and analyze a single stock, stopping short of scoring
+        
+        Args:
+            symbol: Stock symbol
+            technical: Precomputed technical analysis (computed here if None)
+            price_data: Price history already fetched for this symbol (fetched here if None)
+            delivery: Precomputed delivery trend (fetched here if omitted)
+        
+        Returns:
+            Tuple of (symbol, fundamentals, technical, fundamental, delivery)
+            analyses, or None if failed
+        """
         clean_symbol = sanitize_symbol(symbol)
         if not clean_symbol:
             return None
         
         try:
-            # Fetch data concurrently
-            complete_data = await self.async_yf_fetcher.fetch_complete_data(clean_symbol)
-            
-            fundamentals = complete_data['fundamentals']
-            price_data = complete_data['price_history']
+            if price_data is not None and not price_data.empty:
+                # History came with the batch - only fundamentals are left to fetch
+                fundamentals = await self.async_yf_fetcher.fetch_fundamentals(
+                    clean_symbol,
+                    fast=self.technical_only
+                )
+            else:
+                # Fetch data concurrently
+                complete_data = await self.async_yf_fetcher.fetch_complete_data(
+                    clean_symbol,
+                    fast_fundamentals=self.technical_only
+                )
+                
+                fundamentals = complete_data['fundamentals']
+                price_data = complete_data['price_history']
             
             if not fundamentals or price_data is None or price_data.empty:
                 logger.debug(f"Insufficient data for {clean_symbol}")
                 return None
             
-            # Technical analysis (CPU-bound, but fast)
-            technical = self.technical_analyzer.analyze(price_data)
+            # Technical analysis (CPU-bound, but fast) unless the batch pass already did it
+            if technical is None:
+                technical = self.technical_analyzer.analyze(price_data)
             if not technical:
                 logger.debug(f"Technical analysis failed for {clean_symbol}")
                 return None
             
-            # Fundamental analysis
-            fundamental = self.fundamental_analyzer.analyze(fundamentals)
+            # Fundamental analysis (quote-only data has no ratios to score)
+            fundamental = None if self.technical_only else self.fundamental_analyzer.analyze(fundamentals)
             
             # Delivery data (optional) - 90-day lookback for smart money detection
-            delivery = None
-            if self.use_delivery and self.delivery_fetcher:
-                # Run in executor to avoid blocking
-                loop = asyncio.get_event_loop()
-                delivery = await loop.run_in_executor(
-                    None,
-                    self.delivery_fetcher.fetch_delivery_trend,
-                    clean_symbol,
-                    90,  # 90-day lookback for quantity spike detection
-                    2.0  # 2x baseline = spike threshold
-                )
+            if delivery is _FETCH:
+                delivery = None
+                if self.use_delivery and self.delivery_fetcher:
+                    # Run in executor to avoid blocking
+                    loop = asyncio.get_event_loop()
+                    delivery = await loop.run_in_executor(
+                        None,
+                        self.delivery_fetcher.fetch_delivery_trend,
+                        clean_symbol,
+                        90,  # 90-day lookback for quantity spike detection
+                        2.0  # 2x baseline = spike threshold
+                    )
             
-            # Calculate score
-            score_result = self.scorer.calculate_score(
-                technical_analysis=technical,
-                fundamental_analysis=fundamental,
-                delivery_data=delivery
-            )
-            
-            # Compile result
-            result = {
-                'Symbol': clean_symbol,
-                'Company': fundamentals.get('company_name', clean_symbol),
-                'Sector': fundamentals.get('sector', 'N/A'),
-                'Price': technical.get('current_price', 0),
-                
-                # Legacy single EMA columns (for compatibility)
-                'EMA-44': technical.get('ema', 0),
-                'Price_vs_EMA': technical.get('price_vs_ema', 'N/A'),
-                'Price_Diff_%': technical.get('price_diff_pct', 0),
-                'EMA_Slope_%': technical.get('slope_pct', 0),
-                'Trend': technical.get('overall_trend', 'N/A'),
-                
-                # Multi-timeframe EMA columns (NEW)
-                'Daily_EMA_252': technical.get('daily_ema_252', 0),
-                'Daily_vs_EMA': technical.get('daily_vs_ema', 'N/A'),
-                'Daily_Diff_%': technical.get('daily_diff_pct', 0),
-                'Daily_Slope_%': technical.get('daily_slope_pct', 0),
-                
-                'Weekly_EMA_260': technical.get('weekly_ema_260', 0),
-                'Weekly_vs_EMA': technical.get('weekly_vs_ema', 'N/A'),
-                'Weekly_Diff_%': technical.get('weekly_diff_pct', 0),
-                'Weekly_Slope_%': technical.get('weekly_slope_pct', 0),
-                
-                'Timeframe_Alignment': technical.get('timeframe_alignment', 0),
-                'Trend_Strength': technical.get('trend_strength', 'N/A'),
-                
-                # Fundamental data
-                'Market_Cap_Cr': fundamentals.get('market_cap', 0),
-                'P/E': fundamentals.get('pe_ratio', 0),
-                'ROE_%': fundamentals.get('roe', 0),
-                'Debt/Equity': fundamentals.get('debt_to_equity', 0),
-                
-                # Delivery data - QUANTITY ANALYSIS (Smart money detection)
-                'Delivery_Qty': delivery.get('latest_delivery_qty', 0) if delivery else 0,
-                'Delivery_Qty_Avg': delivery.get('avg_delivery_qty', 0) if delivery else 0,
-                'Delivery_Qty_Spike': delivery.get('qty_spike_ratio', 0) if delivery else 0,
-                'Has_Qty_Spike': delivery.get('has_qty_spike', False) if delivery else False,
-                'Delivery_%': delivery.get('latest_delivery_pct', 0) if delivery else 0,
-                'Delivery_Qty_Trend': delivery.get('qty_trend', 'N/A') if delivery else 'N/A',
-                
-                # Scoring
-                'Score': score_result.get('total_score', 0),
-                'Signal': score_result.get('signal', 'AVOID'),
-                'Tech_Score': score_result['breakdown'].get('technical', 0),
-                'Fund_Score': score_result['breakdown'].get('fundamental', 0),
-                'Deliv_Score': score_result['breakdown'].get('delivery', 0)
-            }
-            
-            # Add raw data for step-by-step export (if requested)
-            if save_raw_data and delivery:
-                result['raw_data'] = {
-                    'Symbol': clean_symbol,
-                    'Delivery_Qty': delivery.get('latest_delivery_qty', 0),
-                    'Delivery_Qty_Avg': delivery.get('avg_delivery_qty', 0),
-                    'Delivery_Qty_Baseline': delivery.get('baseline_delivery_qty', 0),
-                    'Delivery_Qty_Spike_Ratio': delivery.get('qty_spike_ratio', 0),
-                    'Has_Qty_Spike': delivery.get('has_qty_spike', False),
-                    'Delivery_Pct': delivery.get('latest_delivery_pct', 0),
-                    'Qty_Trend': delivery.get('qty_trend', 'N/A'),
-                    'Lookback_Days': delivery.get('lookback_days', 0),
-                    'Data_Points': delivery.get('data_points', 0)
-                }
-            
-            return result
+            return clean_symbol, fundamentals, technical, fundamental, delivery
             
         except Exception as e:
             logger.error(f"Error analyzing {clean_symbol}: {str(e)}")
             return None
     
+    def _compile_result(
+        self,
+        clean_symbol: str,
+        fundamentals: Dict[str, Any],
+        technical: Dict[str, Any],
+        fundamental: Optional[Dict[str, Any]],
+        delivery: Optional[Dict[str, Any]],
+        score_result: Dict[str, Any],
+        save_raw_data: bool = False
+    ) -> Dict[str, Any]:
+        """Result row for one collected, scored stock"""
+        # Empty dict stands in for missing delivery data
+        deliv = delivery or {}
+        breakdown = score_result['breakdown']
+        result = {
+            'Symbol': clean_symbol,
+            'Company': fundamentals.get('company_name', clean_symbol),
+            'Sector': fundamentals.get('sector', 'N/A'),
+            'Price': technical.get('current_price', 0),
+            
+            # Legacy single EMA columns (for compatibility)
+            'EMA-44': technical.get('ema', 0),
+            'Price_vs_EMA': technical.get('price_vs_ema', 'N/A'),
+            'Price_Diff_%': technical.get('price_diff_pct', 0),
+            'EMA_Slope_%': technical.get('slope_pct', 0),
+            'Trend': technical.get('overall_trend', 'N/A'),
+            
+            # Multi-timeframe EMA columns (NEW)
+            'Daily_EMA_252': technical.get('daily_ema_252', 0),
+            'Daily_vs_EMA': technical.get('daily_vs_ema', 'N/A'),
+            'Daily_Diff_%': technical.get('daily_diff_pct', 0),
+            'Daily_Slope_%': technical.get('daily_slope_pct', 0),
+            
+            'Weekly_EMA_260': technical.get('weekly_ema_260', 0),
+            'Weekly_vs_EMA': technical.get('weekly_vs_ema', 'N/A'),
+            'Weekly_Diff_%': technical.get('weekly_diff_pct', 0),
+            'Weekly_Slope_%': technical.get('weekly_slope_pct', 0),
+            
+            'Timeframe_Alignment': technical.get('timeframe_alignment', 0),
+            'Trend_Strength': technical.get('trend_strength', 'N/A'),
+            
+            # Fundamental data
+            'Market_Cap_Cr': fundamentals.get('market_cap', 0),
+            'P/E': fundamentals.get('pe_ratio', 0),
+            'ROE_%': fundamentals.get('roe', 0),
+            'Debt/Equity': fundamentals.get('debt_to_equity', 0),
+            
+            # Delivery data - QUANTITY ANALYSIS (Smart money detection)
+            'Delivery_Qty': deliv.get('latest_delivery_qty', 0),
+            'Delivery_Qty_Avg': deliv.get('avg_delivery_qty', 0),
+            'Delivery_Qty_Spike': deliv.get('qty_spike_ratio', 0),
+            'Has_Qty_Spike': deliv.get('has_qty_spike', False),
+            'Delivery_%': deliv.get('latest_delivery_pct', 0),
+            'Delivery_Qty_Trend': deliv.get('qty_trend', 'N/A'),
+            
+            # Scoring
+            'Score': score_result.get('total_score', 0),
+            'Signal': score_result.get('signal', 'AVOID'),
+            'Tech_Score': breakdown.get('technical', 0),
+            'Fund_Score': breakdown.get('fundamental', 0),
+            'Deliv_Score': breakdown.get('delivery', 0)
+        }
+        
+        # Add raw data for step-by-step export (if requested)
+        if save_raw_data and delivery:
+            result['raw_data'] = {
+                'Symbol': clean_symbol,
+                'Delivery_Qty': delivery.get('latest_delivery_qty', 0),
+                'Delivery_Qty_Avg': delivery.get('avg_delivery_qty', 0),
+                'Delivery_Qty_Baseline': delivery.get('baseline_delivery_qty', 0),
+                'Delivery_Qty_Spike_Ratio': delivery.get('qty_spike_ratio', 0),
+                'Has_Qty_Spike': delivery.get('has_qty_spike', False),
+                'Delivery_Pct': delivery.get('latest_delivery_pct', 0),
+                'Qty_Trend': delivery.get('qty_trend', 'N/A'),
+                'Lookback_Days': delivery.get('lookback_days', 0),
+                'Data_Points': delivery.get('data_points', 0)
+            }
+        
+        return result
+    
     def get_top_buys(self, n: int = 20) -> pd.DataFrame:
         """Get top N BUY signals - uses cached DataFrame"""
         df = self.results_df
         if df.empty:
             return df
         
-        buys = df[df['Signal'] == 'BUY'].head(n)
-        return buys
+        # results_df is already score-sorted: take the first n BUY rows by position
+        # instead of copying every BUY row and then truncating
+        return df.take(np.flatnonzero(df['Signal'] == 'BUY')[:n])
     
     def get_by_signal(self, signal: str) -> pd.DataFrame:
         """Get stocks by signal type - uses cached DataFrame"""
@@ -318,6 +520,14 @@ class AsyncStockDataPipeline:
         
         return self.csv_exporter.export(df, filename=filename)
     
+    def export_to_parquet(self, filename: Optional[str] = None) -> str:
+        """Export results to Parquet (dtypes preserved, fast to reload)"""
+        df = self.results_df
+        if df.empty:
+            raise ValueError("No results to export")
+        
+        return self.parquet_exporter.export(df, filename=filename)
+    
     def export_to_excel(
         self,
         filename: Optional[str] = None,
@@ -340,15 +550,19 @@ class AsyncStockDataPipeline:
             return self.excel_exporter.export(df, filename=filename)
     
     async def export_async(self, filename: Optional[str] = None) -> Dict[str, str]:
-        """Export both CSV and Excel concurrently"""
+        """Export CSV and Excel (plus Parquet when pyarrow is installed) concurrently"""
         loop = asyncio.get_event_loop()
         
-        csv_task = loop.run_in_executor(None, self.export_to_csv, filename)
-        excel_task = loop.run_in_executor(None, self.export_to_excel, filename, True)
+        tasks = {
+            'csv': loop.run_in_executor(None, self.export_to_csv, filename),
+            'excel': loop.run_in_executor(None, self.export_to_excel, filename, True)
+        }
+        if PYARROW_AVAILABLE:
+            tasks['parquet'] = loop.run_in_executor(None, self.export_to_parquet, filename)
         
-        csv_path, excel_path = await asyncio.gather(csv_task, excel_task)
+        paths = await asyncio.gather(*tasks.values())
         
-        return {'csv': csv_path, 'excel': excel_path}
+        return dict(zip(tasks, paths))
     
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics - uses cached DataFrame"""
@@ -356,11 +570,14 @@ class AsyncStockDataPipeline:
         if df.empty:
             return {}
         
+        # One pass over the signal column instead of a mask per signal
+        signal_counts = df['Signal'].value_counts()
+        
         return {
             'total_stocks': len(df),
-            'buy_signals': len(df[df['Signal'] == 'BUY']),
-            'hold_signals': len(df[df['Signal'] == 'HOLD']),
-            'avoid_signals': len(df[df['Signal'] == 'AVOID']),
+            'buy_signals': int(signal_counts.get('BUY', 0)),
+            'hold_signals': int(signal_counts.get('HOLD', 0)),
+            'avoid_signals': int(signal_counts.get('AVOID', 0)),
             'avg_score': round(df['Score'].mean(), 2),
             'top_score': round(df['Score'].max(), 2),
             'failed_stocks': len(self.failed_symbols),
@@ -383,6 +600,16 @@ class AsyncStockDataPipeline:
             'results_cached': hasattr(self, 'results_df'),
             'results_count': len(self.results)
         }
+    
+    def close(self):
+        """Release the yfinance fetcher's thread pool"""
+        self.async_yf_fetcher.close()
+    
+    async def __aenter__(self) -> 'AsyncStockDataPipeline':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
 
 
 def run_async_pipeline(symbols: Optional[List[str]] = None, **kwargs) -> pd.DataFrame:
@@ -397,4 +624,7 @@ def run_async_pipeline(symbols: Optional[List[str]] = None, **kwargs) -> pd.Data
         DataFrame with analysis results
     """
     pipeline = AsyncStockDataPipeline(**kwargs)
-    return asyncio.run(pipeline.fetch_all_data_async(symbols))
+    try:
+        return asyncio.run(pipeline.fetch_all_data_async(symbols))
+    finally:
+        pipeline.close()
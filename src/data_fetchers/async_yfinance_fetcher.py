@@ -1,37 +1,53 @@
 """Async YFinance Data Fetcher Module - High-performance async data fetching"""
 
-import aiohttp
 import asyncio
 import pandas as pd
-import numpy as np
 from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
-import yfinance as yf
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from ..utils.validators import validate_symbol, sanitize_symbol
 from config.config import config
 
+try:
+    import pyarrow.parquet as pq  # parquet engine for the on-disk price cache
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
 class AsyncYFinanceDataFetcher:
     """Async stock data fetcher from Yahoo Finance - 10-20x faster than sync version"""
     
-    def __init__(self, cache_ttl: int = 3600, max_concurrent: int = 50):
+    # Per-user cache, independent of the working directory and outside the repo
+    PRICE_CACHE_DIR = os.path.expanduser("~/.cache/nifty_alpha")
+    
+    def __init__(self, cache_ttl: int = 3600, max_concurrent: int = 50, disk_cache: bool = True):
         """
         Initialize async YFinance data fetcher
         
         Args:
             cache_ttl: Cache time-to-live in seconds
             max_concurrent: Maximum concurrent requests
+            disk_cache: Keep price history as parquet under PRICE_CACHE_DIR
+                        for cache_ttl seconds (requires pyarrow)
         """
         self.cache_ttl = cache_ttl
         self.max_concurrent = max_concurrent
+        self.disk_cache = disk_cache and PYARROW_AVAILABLE
         self._cache = {}
         self._cache_timestamps = {}
         self._semaphore = asyncio.Semaphore(max_concurrent)
         
+        # yfinance calls are blocking I/O; the loop's default executor caps at
+        # min(32, cpu + 4) threads, below max_concurrent, so size our own pool
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix='yfinance')
+        
         # Get price history days from config
         self.price_history_days = config.get('data', {}).get('price_history_days', 1825)
     
@@ -56,12 +72,14 @@ class AsyncYFinanceDataFetcher:
             for symbol, result in zip(symbols, results)
         }
     
-    async def fetch_fundamentals(self, symbol: str) -> Optional[Dict[str, Any]]:
+    async def fetch_fundamentals(self, symbol: str, fast: bool = False) -> Optional[Dict[str, Any]]:
         """
         Fetch fundamental data for a stock (async)
         
         Args:
             symbol: Stock symbol
+            fast: Quote-only fetch via fast_info (skips the slow Ticker.info
+                  request; ratio fields are left at their neutral defaults)
         
         Returns:
             Dictionary with fundamental metrics or None if failed
@@ -72,7 +90,7 @@ class AsyncYFinanceDataFetcher:
             return None
         
         # Check cache
-        cache_key = f"fundamentals_{clean_symbol}"
+        cache_key = f"fundamentals_fast_{clean_symbol}" if fast else f"fundamentals_{clean_symbol}"
         if self._is_cache_valid(cache_key):
             return self._cache[cache_key]
         
@@ -81,8 +99,8 @@ class AsyncYFinanceDataFetcher:
                 # yfinance doesn't have native async, so run in executor
                 loop = asyncio.get_event_loop()
                 fundamentals = await loop.run_in_executor(
-                    None, 
-                    self._fetch_fundamentals_sync, 
+                    self._executor, 
+                    self._fetch_fast_fundamentals_sync if fast else self._fetch_fundamentals_sync, 
                     clean_symbol
                 )
                 
@@ -99,6 +117,8 @@ class AsyncYFinanceDataFetcher:
     
     def _fetch_fundamentals_sync(self, clean_symbol: str) -> Optional[Dict[str, Any]]:
         """Synchronous helper for yfinance calls"""
+        import yfinance as yf  # lazy - only needed once a fetch actually runs
+        
         try:
             yf_symbol = f"{clean_symbol}.NS"
             ticker = yf.Ticker(yf_symbol)
@@ -128,6 +148,40 @@ class AsyncYFinanceDataFetcher:
             logger.error(f"Error in sync fetch for {clean_symbol}: {str(e)}")
             return None
     
+    def _fetch_fast_fundamentals_sync(self, clean_symbol: str) -> Optional[Dict[str, Any]]:
+        """Synchronous helper for quote-only (fast_info) fundamentals"""
+        import yfinance as yf
+        
+        try:
+            yf_symbol = f"{clean_symbol}.NS"
+            fast_info = yf.Ticker(yf_symbol).fast_info
+            
+            current_price = fast_info['last_price']
+            if not current_price:
+                logger.warning(f"No quote available for {yf_symbol}")
+                return None
+            
+            market_cap = fast_info['market_cap']
+            
+            # Same keys as _fetch_fundamentals_sync; ratios aren't in fast_info
+            return {
+                'symbol': clean_symbol,
+                'company_name': clean_symbol,
+                'market_cap': market_cap / 1e7 if market_cap else 0,
+                'pe_ratio': 0,
+                'pb_ratio': 0,
+                'roe': 0,
+                'debt_to_equity': 0,
+                'beta': 1,
+                'sector': 'N/A',
+                'industry': 'N/A',
+                'current_price': current_price
+            }
+            
+        except Exception as e:
+            logger.error(f"Error in fast fetch for {clean_symbol}: {str(e)}")
+            return None
+    
     async def fetch_price_history_batch(
         self,
         symbols: List[str],
@@ -145,6 +199,9 @@ class AsyncYFinanceDataFetcher:
         Returns:
             Dictionary mapping symbols to price DataFrames
         """
+        # One batched download; the per-symbol calls below then hit the cache
+        await self.prefetch_price_history(symbols, period, interval)
+        
         tasks = [
             self.fetch_price_history(symbol, period, interval) 
             for symbol in symbols
@@ -156,6 +213,123 @@ class AsyncYFinanceDataFetcher:
             for symbol, result in zip(symbols, results)
         }
     
+    async def prefetch_price_history(
+        self,
+        symbols: List[str],
+        period: str = None,
+        interval: str = "1d"
+    ) -> int:
+        """
+        Warm the price cache for many symbols with one batched download
+        
+        yf.download fetches all tickers in a single call (threaded inside
+        yfinance) instead of one Ticker.history round-trip per symbol.
+        Subsequent fetch_price_history calls for the same period/interval
+        are served from cache; symbols missing from the batch fall back to
+        the per-ticker path as before.
+        
+        Args:
+            symbols: List of stock symbols
+            period: Time period (if None, uses config price_history_days)
+            interval: Data interval
+        
+        Returns:
+            Number of symbols cached
+        """
+        if period is None:
+            period = f"{self.price_history_days}d"
+        
+        # Only download what isn't already cached
+        pending = []
+        for symbol in symbols:
+            clean_symbol = sanitize_symbol(symbol)
+            if clean_symbol and not self._is_cache_valid(f"price_{clean_symbol}_{period}_{interval}"):
+                pending.append(clean_symbol)
+        
+        if not pending:
+            return 0
+        
+        try:
+            loop = asyncio.get_event_loop()
+            histories = await loop.run_in_executor(
+                self._executor,
+                self._download_price_history_sync,
+                pending,
+                period,
+                interval
+            )
+        except Exception as e:
+            logger.error(f"Error in batched price download: {str(e)}")
+            return 0
+        
+        now = datetime.now()
+        for clean_symbol, hist in histories.items():
+            cache_key = f"price_{clean_symbol}_{period}_{interval}"
+            self._cache[cache_key] = hist
+            self._cache_timestamps[cache_key] = now
+        
+        return len(histories)
+    
+    def _download_price_history_sync(
+        self,
+        clean_symbols: List[str],
+        period: str,
+        interval: str
+    ) -> Dict[str, pd.DataFrame]:
+        """Synchronous helper for batched price history"""
+        import yfinance as yf
+        
+        # Fresh parquet cache hits first; download only the rest
+        histories = {}
+        missing = []
+        for clean_symbol in clean_symbols:
+            hist = self._read_disk_cache(clean_symbol, period, interval)
+            if hist is not None:
+                histories[clean_symbol] = hist
+            else:
+                missing.append(clean_symbol)
+        
+        if not missing:
+            return histories
+        
+        yf_symbols = [f"{s}.NS" for s in missing]
+        
+        # Same adjustment/columns as Ticker.history so cached frames match
+        data = yf.download(
+            yf_symbols,
+            period=period,
+            interval=interval,
+            group_by='ticker',
+            auto_adjust=True,
+            actions=True,
+            ignore_tz=False,
+            threads=True,
+            progress=False
+        )
+        
+        if data is None or data.empty:
+            return histories
+        
+        # Tickers yfinance actually returned, collected once rather than
+        # rebuilding the column level for every symbol
+        downloaded = set(data.columns.get_level_values(0))
+        
+        for clean_symbol, yf_symbol in zip(missing, yf_symbols):
+            if yf_symbol not in downloaded:
+                continue
+            
+            hist = data[yf_symbol].dropna(how='all')
+            if hist.empty:
+                continue
+            
+            # Clean the data (same shape as _fetch_price_history_sync)
+            hist = hist.reset_index()
+            hist.columns = [str(col).lower() for col in hist.columns]
+            histories[clean_symbol] = hist
+            self._write_disk_cache(clean_symbol, period, interval, hist)
+        
+        return histories
+    
     async def fetch_price_history(
         self, 
         symbol: str, 
@@ -192,7 +366,7 @@ class AsyncYFinanceDataFetcher:
                 # Run in executor (yfinance is sync)
                 loop = asyncio.get_event_loop()
                 hist = await loop.run_in_executor(
-                    None,
+                    self._executor,
                     self._fetch_price_history_sync,
                     clean_symbol,
                     period,
@@ -218,6 +392,12 @@ class AsyncYFinanceDataFetcher:
         interval: str
     ) -> Optional[pd.DataFrame]:
         """Synchronous helper for price history"""
+        import yfinance as yf
+        
+        hist = self._read_disk_cache(clean_symbol, period, interval)
+        if hist is not None:
+            return hist
+        
         try:
             yf_symbol = f"{clean_symbol}.NS"
             ticker = yf.Ticker(yf_symbol)
@@ -232,26 +412,67 @@ class AsyncYFinanceDataFetcher:
             hist = hist.reset_index()
             hist.columns = [col.lower() for col in hist.columns]
             
+            self._write_disk_cache(clean_symbol, period, interval, hist)
             return hist
             
         except Exception as e:
             logger.error(f"Error in sync price fetch: {str(e)}")
             return None
     
+    def _disk_cache_path(self, clean_symbol: str, period: str, interval: str) -> str:
+        """Parquet path for the price history of a symbol/period/interval"""
+        return os.path.join(self.PRICE_CACHE_DIR, f"{clean_symbol}_{period}_{interval}.parquet")
+    
+    def _read_disk_cache(self, clean_symbol: str, period: str, interval: str) -> Optional[pd.DataFrame]:
+        """Load cached price history from disk, if written within cache_ttl"""
+        if not self.disk_cache:
+            return None
+        
+        path = self._disk_cache_path(clean_symbol, period, interval)
+        try:
+            # Same TTL as the in-memory cache, measured from the file's write time
+            if time.time() - os.path.getmtime(path) >= self.cache_ttl:
+                return None
+        except OSError:
+            return None
+        
+        try:
+            # Uncompressed file (see _write_disk_cache) memory-mapped from the
+            # page cache - no decompression, and no pandas read_parquet dispatch
+            return pq.read_table(path, memory_map=True).to_pandas()
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable price cache {path}: {str(e)}")
+            return None
+    
+    def _write_disk_cache(self, clean_symbol: str, period: str, interval: str, hist: pd.DataFrame):
+        """Persist price history for reuse by later runs within cache_ttl"""
+        if not self.disk_cache:
+            return
+        
+        path = self._disk_cache_path(clean_symbol, period, interval)
+        try:
+            os.makedirs(self.PRICE_CACHE_DIR, exist_ok=True)
+            # Uncompressed so warm reads can memory-map it; a few hundred KB per symbol
+            hist.to_parquet(path, index=False, compression=None)
+        except Exception as e:
+            logger.debug(f"Could not write price cache {path}: {str(e)}")
+    
     async def fetch_complete_data(
         self,
-        symbol: str
+        symbol: str,
+        fast_fundamentals: bool = False
     ) -> Dict[str, Any]:
         """
         Fetch both fundamentals and price history concurrently
         
         Args:
             symbol: Stock symbol
+            fast_fundamentals: Use the quote-only fundamentals fetch
         
         Returns:
             Dictionary with both fundamentals and price_history
         """
-        fundamentals_task = self.fetch_fundamentals(symbol)
+        fundamentals_task = self.fetch_fundamentals(symbol, fast=fast_fundamentals)
         price_task = self.fetch_price_history(symbol)
         
         fundamentals, price_history = await asyncio.gather(
@@ -278,6 +499,8 @@ class AsyncYFinanceDataFetcher:
         Returns:
             Dictionary mapping symbols to complete data
         """
+        await self.prefetch_price_history(symbols)
+        
         tasks = [self.fetch_complete_data(symbol) for symbol in symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
@@ -300,6 +523,16 @@ class AsyncYFinanceDataFetcher:
         self._cache_timestamps.clear()
         logger.info("Async cache cleared")
     
+    def close(self):
+        """Shut down the fetch thread pool"""
+        self._executor.shutdown(wait=False)
+    
+    async def __aenter__(self) -> 'AsyncYFinanceDataFetcher':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+    
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics"""
         return {
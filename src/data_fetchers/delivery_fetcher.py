@@ -2,18 +2,68 @@
 
 import requests
 import pandas as pd
+import numpy as np
 import io
 import zipfile
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+try:
+    import pyarrow  # noqa: F401 - only needed as the read_csv engine
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from ..utils.retry import retry_with_backoff
 from ..utils.validators import validate_symbol, sanitize_symbol, validate_date
 
 logger = logging.getLogger(__name__)
 
+# Bhavcopy columns we actually use (sec_bhavdata_full has ~15)
+_BHAVCOPY_COLUMNS = ('SYMBOL', 'SERIES', 'TTL_TRD_QNTY', 'DELIV_QTY', 'DELIV_PER')
+
+# Bhavcopy column -> cached column name
+_COLUMN_NAMES = {
+    'SYMBOL': 'symbol',
+    'TTL_TRD_QNTY': 'traded_qty',
+    'DELIV_QTY': 'delivery_qty',
+    'DELIV_PER': 'delivery_percentage'
+}
+
+
+def _read_bhavcopy(text: str) -> pd.DataFrame:
+    """
+    Parse only the needed bhavcopy columns
+    
+    Uses pyarrow's multithreaded CSV reader when pyarrow is installed,
+    otherwise a single C-engine pass. NSE pads headers and values with a
+    leading space (" SERIES", " EQ"); the C engine drops it while tokenizing
+    (skipinitialspace), the pyarrow path strips the text columns afterwards.
+    """
+    if PYARROW_AVAILABLE:
+        # pyarrow takes no callable usecols - match the raw (padded) header names
+        header = text.split('\n', 1)[0].rstrip('\r').split(',')
+        df = pd.read_csv(
+            io.StringIO(text),
+            usecols=[col for col in header if col.strip() in _BHAVCOPY_COLUMNS],
+            engine='pyarrow'
+        )
+        df.columns = df.columns.str.strip()
+        for col in ('SYMBOL', 'SERIES'):
+            if col in df.columns:
+                df[col] = df[col].str.strip()
+        return df
+    
+    return pd.read_csv(
+        io.StringIO(text),
+        usecols=lambda col: col.strip() in _BHAVCOPY_COLUMNS,
+        dtype={'SYMBOL': str, 'SERIES': str},
+        skipinitialspace=True,
+        engine='c'
+    )
+
 
 class DeliveryDataFetcher:
     """Fetch NSE delivery data (bhavcopy) with batch caching for 50-100x speedup"""
@@ -30,6 +80,8 @@ class DeliveryDataFetcher:
         self.session = requests.Session()
         self.session.headers.update(self.HEADERS)
         self._cache = {}
+        self._index = {}  # cache_key -> {symbol: (delivery_pct, delivery_qty, traded_qty)}
+        self._days_newest_first = None  # per-day indices sorted by date, shared by all symbols
         self._warmup_complete = False
     
     def warmup_cache(self, days: int = 10, max_workers: int = 5):
@@ -97,8 +149,10 @@ class DeliveryDataFetcher:
         try:
             df = self._download_bhavcopy(date)
             if df is not None and not df.empty:
-                # Cache the result
+                # Cache the result plus a per-symbol index for O(1) trend lookups
                 self._cache[cache_key] = df.copy()
+                self._index[cache_key] = self._index_bhavcopy(df)
+                self._days_newest_first = None
                 return df
             
             logger.debug(f"No delivery data for {date.strftime('%Y-%m-%d')}")
@@ -118,8 +172,8 @@ class DeliveryDataFetcher:
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
             
-            # Parse CSV
-            df = pd.read_csv(io.StringIO(response.text))
+            # Parse CSV (only the columns we use)
+            df = _read_bhavcopy(response.text)
             
             # Strip whitespace from column names AND values (NSE files have leading spaces everywhere)
             df.columns = df.columns.str.strip()
@@ -135,15 +189,8 @@ class DeliveryDataFetcher:
                 logger.debug(f"No SERIES column in bhavcopy for {date_str}, using full dataset")
             
             # Select relevant columns if they exist
-            columns_map = {}
-            if 'SYMBOL' in df.columns:
-                columns_map['SYMBOL'] = 'symbol'
-            if 'TTL_TRD_QNTY' in df.columns:
-                columns_map['TTL_TRD_QNTY'] = 'traded_qty'
-            if 'DELIV_QTY' in df.columns:
-                columns_map['DELIV_QTY'] = 'delivery_qty'
-            if 'DELIV_PER' in df.columns:
-                columns_map['DELIV_PER'] = 'delivery_percentage'
+            columns = set(df.columns)
+            columns_map = {raw: name for raw, name in _COLUMN_NAMES.items() if raw in columns}
             
             if not columns_map:
                 logger.debug(f"No expected columns found in bhavcopy for {date_str}")
@@ -189,6 +236,40 @@ class DeliveryDataFetcher:
         Returns:
             Dictionary with quantity analysis, spike detection, and trend
         """
+        stats = self._delivery_stats(symbol, days, spike_threshold)
+        return self._label_trends([stats])[0] if stats else None
+    
+    def fetch_delivery_trends(
+        self,
+        symbols: List[str],
+        days: int = 90,
+        spike_threshold: float = 2.0
+    ) -> Dict[str, Optional[Dict[str, any]]]:
+        """
+        fetch_delivery_trend for a batch of symbols
+        
+        Per-symbol stats are gathered first, then every qty/pct trend in the
+        batch is classified with one vectorized comparison.
+        
+        Args:
+            symbols: Stock symbols
+            days: Number of days to analyze
+            spike_threshold: Multiplier for spike detection
+        
+        Returns:
+            Dictionary mapping each symbol to its delivery trend (None if unavailable)
+        """
+        stats = {symbol: self._delivery_stats(symbol, days, spike_threshold) for symbol in symbols}
+        self._label_trends([s for s in stats.values() if s])
+        return stats
+    
+    def _delivery_stats(
+        self,
+        symbol: str,
+        days: int,
+        spike_threshold: float
+    ) -> Optional[Dict[str, any]]:
+        """Delivery trend dict with raw trend changes (labelled by _label_trends)"""
         clean_symbol = sanitize_symbol(symbol)
         if not clean_symbol:
             logger.debug(f"Invalid symbol: {symbol}")
@@ -198,45 +279,46 @@ class DeliveryDataFetcher:
         if not self._warmup_complete and len(self._cache) < days:
             self.warmup_cache(days=days, max_workers=10)
         
-        delivery_data = []
-        
-        # Fast lookup from cached bhavcopy files
-        for cache_key in sorted(self._cache.keys(), reverse=True)[:days]:
-            df = self._cache[cache_key]
-            if 'symbol' in df.columns:
-                symbol_data = df[df['symbol'] == clean_symbol]
-                if not symbol_data.empty:
-                    delivery_data.append({
-                        'date': datetime.strptime(cache_key, "%Y%m%d"),
-                        'delivery_percentage': symbol_data.iloc[0].get('delivery_percentage', 0),
-                        'delivery_qty': symbol_data.iloc[0].get('delivery_qty', 0),
-                        'traded_qty': symbol_data.iloc[0].get('traded_qty', 0)
-                    })
-        
-        if not delivery_data:
+        # Fast lookup from the per-date symbol index (no DataFrame scans), newest first
+        rows = [
+            row for row in (day.get(clean_symbol) for day in self._get_days_newest_first()[:days])
+            if row is not None
+        ]
+        
+        if not rows:
             return None
         
+        all_pcts = np.array([row[0] for row in rows])
+        all_qtys = np.array([row[1] for row in rows])
+        
         # Extract quantities and percentages
-        quantities = [d['delivery_qty'] for d in delivery_data if d['delivery_qty'] > 0]
-        percentages = [d['delivery_percentage'] for d in delivery_data if d['delivery_percentage'] > 0]
+        # Quantities only need a count, a sum and the newest positive value,
+        # so they are reduced under a mask instead of gathered into a copy;
+        # percentages are gathered because the trend splits the kept days
+        has_qty = all_qtys > 0
+        n_qty = int(np.count_nonzero(has_qty))
+        percentages = all_pcts[all_pcts > 0]
         
-        if not quantities:
+        if not n_qty:
             return None
         
         # QUANTITY ANALYSIS (This is the smart money indicator)
-        latest_qty = quantities[0]
-        avg_qty = sum(quantities) / len(quantities)
+        # One reduction serves both the average and the baseline; quantities
+        # are whole shares, so the float sums are exact
+        latest_qty = all_qtys[has_qty.argmax()].item()
+        total_qty = float(all_qtys.sum(where=has_qty))
+        avg_qty = total_qty / n_qty
         
         # Historical baseline (exclude latest for comparison)
-        baseline_qty = sum(quantities[1:]) / len(quantities[1:]) if len(quantities) > 1 else avg_qty
+        baseline_qty = (total_qty - latest_qty) / (n_qty - 1) if n_qty > 1 else avg_qty
         
         # Spike detection - Is current delivery quantity unusual?
         qty_spike_ratio = latest_qty / baseline_qty if baseline_qty > 0 else 1.0
         has_qty_spike = qty_spike_ratio >= spike_threshold
         
         # Percentage analysis
-        latest_pct = percentages[0] if percentages else 0
-        avg_pct = sum(percentages) / len(percentages) if percentages else 0
+        latest_pct = percentages[0].item() if percentages.size else 0
+        avg_pct = float(percentages.mean()) if percentages.size else 0
         
         return {
             'symbol': clean_symbol,
@@ -252,31 +334,62 @@ class DeliveryDataFetcher:
             'latest_delivery_pct': latest_pct,
             'avg_delivery_pct': avg_pct,
             
-            # TREND
-            'qty_trend': self._calculate_trend([d['delivery_qty'] for d in delivery_data]),
-            'pct_trend': self._calculate_trend(percentages),
+            # TREND (% change between halves until _label_trends classifies it)
+            'qty_trend': self._trend_change(all_qtys),
+            'pct_trend': self._trend_change(percentages),
             
-            'data_points': len(delivery_data),
+            'data_points': len(rows),
             'lookback_days': days
         }
     
-    def _calculate_trend(self, percentages: List[float]) -> str:
-        """Calculate delivery percentage trend"""
-        if len(percentages) < 2:
-            return "insufficient_data"
-        
-        # Simple linear regression or comparison
-        first_half = sum(percentages[:len(percentages)//2]) / (len(percentages)//2)
-        second_half = sum(percentages[len(percentages)//2:]) / (len(percentages) - len(percentages)//2)
-        
-        diff = ((second_half - first_half) / first_half * 100) if first_half > 0 else 0
-        
-        if diff > 5:
-            return "rising"
-        elif diff < -5:
-            return "falling"
-        else:
-            return "stable"
+    @staticmethod
+    def _index_bhavcopy(df: pd.DataFrame) -> Dict[str, Tuple[float, float, float]]:
+        """Build {symbol: (delivery_pct, delivery_qty, traded_qty)} from a parsed bhavcopy"""
+        if 'symbol' not in df.columns:
+            return {}
+        
+        # Keep the first row per symbol, matching a filtered .iloc[0] lookup
+        df = df.drop_duplicates(subset='symbol')
+        zeros = [0] * len(df)
+        return dict(zip(
+            df['symbol'].tolist(),
+            zip(
+                df['delivery_percentage'].tolist() if 'delivery_percentage' in df.columns else zeros,
+                df['delivery_qty'].tolist() if 'delivery_qty' in df.columns else zeros,
+                df['traded_qty'].tolist() if 'traded_qty' in df.columns else zeros
+            )
+        ))
+    
+    @staticmethod
+    def _trend_change(values: np.ndarray) -> float:
+        """% change between the mean of each half (NaN when there is too little data)"""
+        if len(values) < 2:
+            return np.nan
+        
+        half = len(values) // 2
+        first_half = values[:half].mean()
+        second_half = values[half:].mean()
+        
+        diff = ((second_half - first_half) / first_half * 100) if first_half > 0 else 0.0
+        # Undefined change (NaN history) counts as stable, not insufficient
+        return 0.0 if diff != diff else float(diff)
+    
+    @staticmethod
+    def _label_trends(stats: List[Dict[str, any]]) -> List[Dict[str, any]]:
+        """Classify every qty/pct trend change in stats in one vectorized pass (in place)"""
+        if not stats:
+            return stats
+        
+        changes = np.array([[s['qty_trend'], s['pct_trend']] for s in stats])
+        labels = np.select(
+            [np.isnan(changes), changes > 5, changes < -5],
+            ['insufficient_data', 'rising', 'falling'],
+            'stable'
+        ).tolist()
+        for s, (qty_trend, pct_trend) in zip(stats, labels):
+            s['qty_trend'] = qty_trend
+            s['pct_trend'] = pct_trend
+        return stats
     
     def _get_previous_trading_day(self) -> datetime:
         """Get the previous trading day (excluding weekends)"""
@@ -294,4 +407,20 @@ class DeliveryDataFetcher:
     def clear_cache(self):
         """Clear cached delivery data"""
         self._cache.clear()
+        self._index.clear()
+        self._days_newest_first = None
         logger.info("Delivery data cache cleared")
+    
+    def _get_days_newest_first(self) -> List[Dict[str, Tuple[float, float, float]]]:
+        """
+        Per-day symbol indices ordered newest first
+        
+        The date ordering is the same for every symbol, so it is sorted once
+        and reused until the index changes.
+        """
+        days = self._days_newest_first
+        if days is None:
+            index = self._index
+            days = [index[key] for key in sorted(index, reverse=True)]
+            self._days_newest_first = days
+        return days
@@ -6,14 +6,25 @@ Automatically fetches NSE stock symbols and delivery data (bhavcopy)
 
 import requests
 import pandas as pd
+import numpy as np
 import io
 import zipfile
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import time
 import json
 import os
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Bhavcopy column name variations, in order of preference
+DELIV_QTY_COLUMNS = ('DELIV_QTY', 'NO_OF_TRADES', 'QTY_PER_TRADE')
+TRADED_QTY_COLUMNS = ('TTL_TRD_QNTY', 'TOTTRDQTY', 'TRADED_QTY')
+DELIV_PCT_COLUMNS = ('DELIV_PER', 'DELIV_PCT', '%DELY QTY TO TRADED QTY')
+
+# Index entries in the NSE market-data feed that are not tradable equities
+INDEX_SYMBOLS = frozenset({'NIFTY', 'BANKNIFTY', 'NIFTY 50', 'NIFTY BANK'})
 
 
 class NSEDataFetcher:
@@ -37,6 +48,10 @@ class NSEDataFetcher:
         self.session = requests.Session()
         self.session.headers.update(self.HEADERS)
         self._cookies_initialized = False
+        # Per-thread sessions for concurrent bhavcopy downloads
+        self._local = threading.local()
+        # Symbol list memoized for this instance (set from a fresh fetch or valid cache)
+        self._symbols: Optional[Tuple[str, ...]] = None
         self._initialize_session()
     
     def _initialize_session(self):
@@ -66,10 +81,15 @@ class NSEDataFetcher:
         Returns:
             List of stock symbols
         """
+        # Repeat calls reuse the in-memory list instead of re-reading the cache file
+        if self._symbols is not None and not force_refresh:
+            return list(self._symbols)
+        
         # Try loading from cache first (unless force refresh)
         if not force_refresh:
             cached_symbols = self._load_from_cache(silent)
             if cached_symbols:
+                self._symbols = tuple(cached_symbols)
                 return cached_symbols
         
         # Cache miss or force refresh - fetch from NSE
@@ -82,6 +102,7 @@ class NSEDataFetcher:
                 if not silent:
                     print(f"✓ Fetched {len(symbols)} symbols from NSE equity list")
                 self._save_to_cache(symbols)
+                self._symbols = tuple(symbols)
                 return symbols
         except Exception as e:
             if not silent:
@@ -95,6 +116,7 @@ class NSEDataFetcher:
                 if not silent:
                     print(f"✓ Fetched {len(symbols)} symbols from NSE market data")
                 self._save_to_cache(symbols)
+                self._symbols = tuple(symbols)
                 return symbols
         except Exception as e:
             if not silent:
@@ -198,19 +220,20 @@ class NSEDataFetcher:
             if len(lines) < 2:
                 raise Exception("Empty or invalid CSV response")
             
-            symbols = []
+            # dict keys dedupe repeated rows (fetching a symbol twice) and keep file order
+            symbols = {}
             for line in lines[1:]:  # Skip header
                 parts = line.split(',')
                 if len(parts) > 0 and parts[0].strip():
                     symbol = parts[0].strip()
                     # Filter out special characters and ensure valid trading symbols
                     if symbol and symbol.replace('&', '').replace('-', '').isalnum():
-                        symbols.append(symbol)
+                        symbols[symbol] = None
             
             if not symbols:
                 raise Exception("No symbols found in CSV")
             
-            return symbols
+            return list(symbols)
             
         except Exception as e:
             raise Exception(f"Failed to fetch from equity CSV: {str(e)}")
@@ -234,13 +257,13 @@ class NSEDataFetcher:
                 for item in data:
                     if isinstance(item, dict) and 'symbol' in item:
                         symbol = item['symbol']
-                        if symbol and symbol not in ['NIFTY', 'BANKNIFTY', 'NIFTY 50', 'NIFTY BANK']:
+                        if symbol and symbol not in INDEX_SYMBOLS:
                             symbols.add(symbol)
             elif isinstance(data, dict) and 'data' in data:
                 for item in data['data']:
                     if 'symbol' in item:
                         symbol = item['symbol']
-                        if symbol and symbol not in ['NIFTY', 'BANKNIFTY', 'NIFTY 50', 'NIFTY BANK']:
+                        if symbol and symbol not in INDEX_SYMBOLS:
                             symbols.add(symbol)
             
             if not symbols:
@@ -284,6 +307,26 @@ class NSEDataFetcher:
         print(f"⚠️  Could not fetch bhavcopy for {date.strftime('%Y-%m-%d')}")
         return None
     
+    def _thread_session(self) -> requests.Session:
+        """
+        Session for the calling thread
+        
+        requests.Session isn't guaranteed thread-safe (cookie jar, adapter
+        pool), so download workers each get their own, seeded with the
+        shared session's headers and cookies; the main thread keeps using
+        self.session.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self.session
+        
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.session.headers)
+            session.cookies.update(self.session.cookies)
+            self._local.session = session
+        return session
+    
     def _get_last_trading_day(self) -> datetime:
         """Get the last trading day (skip weekends)."""
         today = datetime.now()
@@ -312,7 +355,7 @@ class NSEDataFetcher:
         url = f"https://archives.nseindia.com/content/historical/EQUITIES/{year}/{month}/{filename}"
         
         try:
-            response = self.session.get(url, timeout=15)
+            response = self._thread_session().get(url, timeout=15)
             response.raise_for_status()
             
             # Extract CSV from ZIP
@@ -340,7 +383,7 @@ class NSEDataFetcher:
         url = f"https://archives.nseindia.com/archives/equities/mto/{filename}"
         
         try:
-            response = self.session.get(url, timeout=15)
+            response = self._thread_session().get(url, timeout=15)
             response.raise_for_status()
             
             # Parse the DAT file (it's actually a CSV)
@@ -349,12 +392,16 @@ class NSEDataFetcher:
         except Exception as e:
             raise Exception(f"Reports fetch failed: {e}")
     
-    def fetch_multiple_bhavcopy(self, days: int = 3) -> Dict[str, pd.DataFrame]:
+    def fetch_multiple_bhavcopy(self, days: int = 3, max_workers: int = 3) -> Dict[str, pd.DataFrame]:
         """
         Fetch bhavcopy for multiple days.
         
+        Candidate trading days are downloaded concurrently in waves sized to
+        the number of days still missing, so holidays only cost another wave.
+        
         Args:
             days: Number of past trading days to fetch
+            max_workers: Concurrent download threads
             
         Returns:
             Dictionary mapping date strings to DataFrames
@@ -362,54 +409,89 @@ class NSEDataFetcher:
         bhavcopy_data = {}
         current_date = self._get_last_trading_day()
         
-        fetched = 0
-        attempts = 0
-        max_attempts = days * 3  # Try up to 3x the requested days
-        
-        while fetched < days and attempts < max_attempts:
-            date_str = current_date.strftime('%Y-%m-%d')
-            
-            # Skip weekends
+        # Weekdays only, most recent first - try up to 3x the requested days
+        candidates = []
+        for _ in range(days * 3):
             if current_date.weekday() < 5:
-                df = self.fetch_bhavcopy(current_date)
-                if df is not None:
-                    bhavcopy_data[date_str] = df
-                    fetched += 1
-            
+                candidates.append(current_date)
             current_date -= timedelta(days=1)
-            attempts += 1
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while len(bhavcopy_data) < days and candidates:
+                wave = candidates[:days - len(bhavcopy_data)]
+                candidates = candidates[len(wave):]
+                
+                # map() keeps date order, so the newest days win
+                for date, df in zip(wave, executor.map(self.fetch_bhavcopy, wave)):
+                    if df is not None:
+                        bhavcopy_data[date.strftime('%Y-%m-%d')] = df
         
         return bhavcopy_data
     
+    @staticmethod
+    def index_bhavcopy(bhavcopy_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Index a bhavcopy by upper-cased symbol for repeated lookups.
+        
+        Pass the result to get_delivery_data when extracting many symbols
+        from the same bhavcopy: each lookup becomes a hash hit on the index
+        instead of a string compare over every row.
+        
+        Args:
+            bhavcopy_df: Bhavcopy DataFrame
+            
+        Returns:
+            DataFrame indexed by categorical symbol (unchanged if no symbol column)
+        """
+        cols_upper = {col.upper(): col for col in bhavcopy_df.columns}
+        symbol_col = cols_upper.get('SYMBOL') or cols_upper.get('SYMB')
+        
+        if symbol_col is None:
+            return bhavcopy_df
+        
+        symbols = bhavcopy_df[symbol_col].astype(str).str.strip().str.upper()
+        indexed = bhavcopy_df.drop(columns=symbol_col)
+        indexed.index = pd.CategoricalIndex(symbols, name=symbol_col)
+        
+        # Keep the first row per symbol, as the unindexed lookup does
+        return indexed[~indexed.index.duplicated(keep='first')]
+    
     def get_delivery_data(self, symbol: str, bhavcopy_df: pd.DataFrame) -> Optional[Dict]:
         """
         Extract delivery data for a specific symbol from bhavcopy.
         
         Args:
             symbol: Stock symbol
-            bhavcopy_df: Bhavcopy DataFrame
+            bhavcopy_df: Bhavcopy DataFrame (optionally from index_bhavcopy)
             
         Returns:
             Dictionary with delivery metrics or None
         """
         try:
-            # Find the symbol in bhavcopy
-            symbol_col = None
-            for col in bhavcopy_df.columns:
-                if col.upper() in ['SYMBOL', 'SYMB']:
-                    symbol_col = col
-                    break
-            
-            if symbol_col is None:
-                return None
-            
-            # Filter for the symbol
-            stock_data = bhavcopy_df[bhavcopy_df[symbol_col].str.upper() == symbol.upper()]
-            
-            if stock_data.empty:
-                return None
-            
-            row = stock_data.iloc[0]
+            # Map upper-cased names to actual columns once per call
+            cols_upper = {col.upper(): col for col in bhavcopy_df.columns}
+            
+            index_name = bhavcopy_df.index.name
+            if isinstance(index_name, str) and index_name.upper() in ('SYMBOL', 'SYMB'):
+                # Pre-indexed bhavcopy - hash lookup on the symbol index
+                key = symbol.upper()
+                if key not in bhavcopy_df.index:
+                    return None
+                pos = bhavcopy_df.index.get_loc(key)
+            else:
+                # Find the symbol in bhavcopy
+                symbol_col = cols_upper.get('SYMBOL') or cols_upper.get('SYMB')
+                
+                if symbol_col is None:
+                    return None
+                
+                # Position of the first matching row
+                matches = np.flatnonzero(bhavcopy_df[symbol_col].str.upper() == symbol.upper())
+                
+                if matches.size == 0:
+                    return None
+                
+                pos = matches[0]
             
             # Extract delivery data (column names vary)
             deliv_qty = None
@@ -417,20 +499,18 @@ class NSEDataFetcher:
             deliv_pct = None
             
             # Try different column name variations
-            for col in ['DELIV_QTY', 'NO_OF_TRADES', 'QTY_PER_TRADE']:
-                if col in bhavcopy_df.columns:
-                    deliv_qty = row.get(col)
-                    break
-            
-            for col in ['TTL_TRD_QNTY', 'TOTTRDQTY', 'TRADED_QTY']:
-                if col in bhavcopy_df.columns:
-                    traded_qty = row.get(col)
-                    break
-            
-            for col in ['DELIV_PER', 'DELIV_PCT', '%DELY QTY TO TRADED QTY']:
-                if col in bhavcopy_df.columns:
-                    deliv_pct = row.get(col)
-                    break
+            deliv_col = next((cols_upper[c] for c in DELIV_QTY_COLUMNS if c in cols_upper), None)
+            traded_col = next((cols_upper[c] for c in TRADED_QTY_COLUMNS if c in cols_upper), None)
+            pct_col = next((cols_upper[c] for c in DELIV_PCT_COLUMNS if c in cols_upper), None)
+            
+            # Scalar reads - no row Series is materialized
+            get_loc = bhavcopy_df.columns.get_loc
+            if deliv_col is not None:
+                deliv_qty = bhavcopy_df.iat[pos, get_loc(deliv_col)]
+            if traded_col is not None:
+                traded_qty = bhavcopy_df.iat[pos, get_loc(traded_col)]
+            if pct_col is not None:
+                deliv_pct = bhavcopy_df.iat[pos, get_loc(pct_col)]
             
             # Calculate delivery percentage if not directly available
             if deliv_pct is None and deliv_qty and traded_qty and traded_qty > 0:
@@ -473,6 +553,6 @@ if __name__ == "__main__":
         # Test delivery data extraction
         if symbols:
             print(f"\n3. Testing delivery data extraction for {symbols[0]}...")
-            delivery = fetcher.get_delivery_data(symbols[0], bhavcopy)
+            delivery = fetcher.get_delivery_data(symbols[0], fetcher.index_bhavcopy(bhavcopy))
             if delivery:
                 print(f"   Delivery %: {delivery['delivery_pct']:.2f}%")
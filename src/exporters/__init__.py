@@ -2,5 +2,6 @@
 
 from .csv_exporter import CSVExporter
 from .excel_exporter import ExcelExporter
+from .parquet_exporter import ParquetExporter
 
-__all__ = ['CSVExporter', 'ExcelExporter']
+__all__ = ['CSVExporter', 'ExcelExporter', 'ParquetExporter']
@@ -0,0 +1,74 @@
+"""Parquet Exporter Module"""
+
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from typing import Optional
+import logging
+
+try:
+    import pyarrow  # noqa: F401 - parquet engine
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class ParquetExporter:
+    """Export stock analysis data to Parquet (columnar, typed, compressed)"""
+    
+    def __init__(self, output_dir: str = "data/exports"):
+        """
+        Initialize Parquet exporter
+        
+        Args:
+            output_dir: Directory to save Parquet files
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def export(
+        self,
+        data: pd.DataFrame,
+        filename: Optional[str] = None,
+        include_timestamp: bool = True,
+        compression: str = 'snappy'
+    ) -> str:
+        """
+        Export DataFrame to Parquet
+        
+        Column dtypes (including categoricals) round-trip, so results load
+        back with pd.read_parquet without re-parsing text.
+        
+        Args:
+            data: DataFrame to export
+            filename: Output filename (auto-generated if None)
+            include_timestamp: Whether to include timestamp in filename
+            compression: Parquet compression codec
+        
+        Returns:
+            Path to exported file
+        """
+        try:
+            # Generate filename if not provided
+            if filename is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"stock_analysis_{timestamp}.parquet" if include_timestamp else "stock_analysis.parquet"
+            
+            # Ensure .parquet extension
+            if not filename.endswith('.parquet'):
+                filename += '.parquet'
+            
+            # Full path
+            filepath = self.output_dir / filename
+            
+            # Export to Parquet
+            data.to_parquet(filepath, index=False, compression=compression)
+            
+            logger.info(f"Data exported to Parquet: {filepath}")
+            return str(filepath)
+            
+        except Exception as e:
+            logger.error(f"Error exporting to Parquet: {str(e)}")
+            raise
@@ -1,5 +1,6 @@
 """Scorers Module - Stock scoring and signal generation"""
 
 from .stock_scorer import StockScorer
+from .types import TechnicalAnalysis, FundamentalAnalysis, DeliveryData
 
-__all__ = ['StockScorer']
+__all__ = ['StockScorer', 'TechnicalAnalysis', 'FundamentalAnalysis', 'DeliveryData']
@@ -0,0 +1,76 @@
+"""Numba scoring kernels - JIT-compiled batch scoring for StockScorer"""
+
+try:
+    from numba import vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # Explicit signatures: compiled eagerly at import, no type inference per call
+    @vectorize(['float64(boolean, float64, boolean, float64)'], cache=True)
+    def _technical_kernel(daily_above, daily_diff, weekly_above, weekly_diff):
+        """
+        Technical score of one stock (mirrors StockScorer._calculate_technical_score)
+        as a ufunc over N stocks
+        """
+        score = 0.0
+
+        # Daily EMA retracement bands
+        if daily_above:
+            if 0.0 <= daily_diff <= 3.0:
+                score += 2.0
+            elif 3.0 < daily_diff <= 5.0:
+                score += 1.5
+            elif 5.0 < daily_diff <= 8.0:
+                score += 1.0
+            elif 8.0 < daily_diff <= 15.0:
+                score += 0.5
+            else:
+                score += 0.25
+
+        # Weekly EMA retracement bands
+        if weekly_above:
+            if 0.0 <= weekly_diff <= 5.0:
+                score += 2.0
+            elif 5.0 < weekly_diff <= 10.0:
+                score += 1.5
+            elif 10.0 < weekly_diff <= 20.0:
+                score += 1.0
+            elif 20.0 < weekly_diff <= 30.0:
+                score += 0.5
+            else:
+                score += 0.25
+
+        return score
+
+    @vectorize(['float64(boolean, float64, float64)'], cache=True)
+    def _delivery_kernel(has_spike, spike_ratio, delivery_pct):
+        """
+        Delivery score of one stock (mirrors StockScorer._calculate_delivery_score)
+        as a ufunc over N stocks
+        """
+        score = 0.0
+
+        # Quantity spike
+        if has_spike:
+            if spike_ratio >= 3.0:
+                score += 2.0
+            elif spike_ratio >= 2.0:
+                score += 1.5
+            else:
+                score += 1.0
+
+        # Percentage confirmation
+        if delivery_pct > 50.0:
+            score += 1.0
+        elif delivery_pct > 35.0:
+            score += 0.5
+
+        return score
+
+else:
+    _technical_kernel = None
+    _delivery_kernel = None
@@ -1,16 +1,59 @@
 """Stock Scorer Module - Calculate final scores and signals"""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional, Sequence, Tuple, Union
+from bisect import bisect_left, bisect_right
 import logging
 
+import numpy as np
+
 from ..utils.validators import validate_score
+from ._stock_scorer_numba import NUMBA_AVAILABLE, _technical_kernel, _delivery_kernel
+from .types import (
+    TechnicalAnalysis, FundamentalAnalysis, DeliveryData,
+    as_technical, as_fundamental, as_delivery
+)
 
 logger = logging.getLogger(__name__)
 
+# Frozen defaults standing in for missing analyses (all score 0)
+_EMPTY_TECHNICAL = TechnicalAnalysis()
+_EMPTY_FUNDAMENTAL = FundamentalAnalysis()
+_EMPTY_DELIVERY = DeliveryData()
+
+# EMA retracement bands (upper edges, inclusive) and their scores:
+# daily  0-3% PERFECT, 3-5% good, 5-8% slightly extended, 8-15% extended, else missed entry
+# weekly 0-5% PERFECT, 5-10% good, 10-20% slightly extended, 20-30% extended, else overbought
+_DAILY_BAND_EDGES = (3.0, 5.0, 8.0, 15.0)
+_WEEKLY_BAND_EDGES = (5.0, 10.0, 20.0, 30.0)
+_BAND_SCORES = (2.0, 1.5, 1.0, 0.5, 0.25)
+
+# Delivery bands: quantity spike ratio (lower edges, inclusive) - <2x accumulation
+# hint, 2x accumulation, 3x+ STRONG accumulation; delivery % (lower edges,
+# exclusive) - >35% moderate, >50% very high
+_SPIKE_RATIO_EDGES = (2.0, 3.0)
+_SPIKE_SCORES = (1.0, 1.5, 2.0)
+_DELIVERY_PCT_EDGES = (35.0, 50.0)
+_DELIVERY_PCT_SCORES = (0.0, 0.5, 1.0)
+
+# Result columns rounded at the display/export boundary
+SCORE_COLUMNS = ('Score', 'Tech_Score', 'Fund_Score', 'Deliv_Score')
+
 
 class StockScorer:
     """Calculate stock scores and generate BUY/HOLD/AVOID signals"""
     
+    _EMOJI_MAP = {
+        'BUY': '🚀',
+        'HOLD': '⏸️',
+        'AVOID': '❌'
+    }
+    
+    _COLOR_MAP = {
+        'BUY': 'green',
+        'HOLD': 'orange',
+        'AVOID': 'red'
+    }
+    
     def __init__(
         self,
         buy_threshold: float = 3.0,
@@ -34,29 +77,54 @@ class StockScorer:
         self.hold_max = hold_max
         self.min_score = min_score
         self.max_score = max_score
+        
+        # Signal bins for vectorized classification (index 0/1/2 = AVOID/HOLD/BUY)
+        self._signal_bins = np.array([hold_min, buy_threshold])
+        self._signal_labels = np.array(['AVOID', 'HOLD', 'BUY'])
+        
+        # Technical band scorer specialized at construction time
+        self._score_technical = self._compile_technical()
+        self._score_delivery = self._compile_delivery()
+        
+        # Prebuilt result for stocks with no analyses at all
+        self._zero_result = self.calculate_score(_EMPTY_TECHNICAL, _EMPTY_FUNDAMENTAL, _EMPTY_DELIVERY)
     
     def calculate_score(
         self,
-        technical_analysis: Optional[Dict[str, Any]] = None,
-        fundamental_analysis: Optional[Dict[str, Any]] = None,
-        delivery_data: Optional[Dict[str, Any]] = None
+        technical_analysis: Union[TechnicalAnalysis, Dict[str, Any], None] = None,
+        fundamental_analysis: Union[FundamentalAnalysis, Dict[str, Any], None] = None,
+        delivery_data: Union[DeliveryData, Dict[str, Any], None] = None
     ) -> Dict[str, Any]:
         """
         Calculate overall stock score based on all analyses
         
         Args:
-            technical_analysis: Technical analysis results
-            fundamental_analysis: Fundamental analysis results
-            delivery_data: Delivery data analysis results
+            technical_analysis: Technical analysis results (dict or TechnicalAnalysis)
+            fundamental_analysis: Fundamental analysis results (dict or FundamentalAnalysis)
+            delivery_data: Delivery data analysis results (dict or DeliveryData)
         
         Returns:
             Dictionary with score breakdown and signal
         """
+        # Nothing to score - skip the try block and hand back a copy of the prebuilt result
+        if technical_analysis is None and fundamental_analysis is None and delivery_data is None:
+            zero = self._zero_result
+            return {
+                **zero,
+                'breakdown': dict(zero['breakdown']),
+                'components': dict(zero['components'])
+            }
+        
         try:
+            # Resolve missing inputs once; the frozen defaults score 0
+            ta = as_technical(technical_analysis) or _EMPTY_TECHNICAL
+            fa = as_fundamental(fundamental_analysis) or _EMPTY_FUNDAMENTAL
+            dd = as_delivery(delivery_data) or _EMPTY_DELIVERY
+            
             # Calculate component scores
-            technical_score = self._calculate_technical_score(technical_analysis)
-            fundamental_score = self._calculate_fundamental_score(fundamental_analysis)
-            delivery_score = self._calculate_delivery_score(delivery_data)
+            technical_score = self._calculate_technical_score(ta)
+            fundamental_score = self._calculate_fundamental_score(fa)
+            delivery_score = self._calculate_delivery_score(dd)
             
             # Total score (capped at min/max)
             total_score = technical_score + fundamental_score + delivery_score
@@ -67,20 +135,20 @@ class StockScorer:
             
             # Create score breakdown
             return {
-                'total_score': round(total_score, 2),
+                'total_score': total_score,
                 'signal': signal,
                 'breakdown': {
-                    'technical': round(technical_score, 2),
-                    'fundamental': round(fundamental_score, 2),
-                    'delivery': round(delivery_score, 2)
+                    'technical': technical_score,
+                    'fundamental': fundamental_score,
+                    'delivery': delivery_score
                 },
                 'components': {
-                    'daily_ema': technical_analysis.get('daily_vs_ema', 'N/A') if technical_analysis else 'N/A',
-                    'weekly_ema': technical_analysis.get('weekly_vs_ema', 'N/A') if technical_analysis else 'N/A',
-                    'timeframe_alignment': technical_analysis.get('timeframe_alignment', 0) if technical_analysis else 0,
+                    'daily_ema': ta.daily_vs_ema,
+                    'weekly_ema': ta.weekly_vs_ema,
+                    'timeframe_alignment': ta.timeframe_alignment,
                     'fundamentals': fundamental_score,
-                    'delivery_qty_spike': delivery_data.get('has_qty_spike', False) if delivery_data else False,
-                    'delivery_qty_ratio': delivery_data.get('qty_spike_ratio', 0) if delivery_data else 0
+                    'delivery_qty_spike': dd.has_qty_spike,
+                    'delivery_qty_ratio': dd.qty_spike_ratio
                 }
             }
             
@@ -93,7 +161,114 @@ class StockScorer:
                 'error': str(e)
             }
     
-    def _calculate_technical_score(self, analysis: Optional[Dict[str, Any]]) -> float:
+    def score_batch(
+        self,
+        technical_analyses: Sequence[Union[TechnicalAnalysis, Dict[str, Any], None]],
+        fundamental_analyses: Sequence[Union[FundamentalAnalysis, Dict[str, Any], None]],
+        delivery_data: Sequence[Union[DeliveryData, Dict[str, Any], None]]
+    ) -> Dict[str, Any]:
+        """
+        Score many stocks at once (Numba kernel if available, else NumPy)
+        
+        Args:
+            technical_analyses: Technical analysis results, one per stock
+            fundamental_analyses: Fundamental analysis results, one per stock
+            delivery_data: Delivery data analysis results, one per stock
+        
+        Returns:
+            calculate_score's total_score/signal/breakdown as arrays aligned
+            with the inputs
+        """
+        ta = [as_technical(t) or _EMPTY_TECHNICAL for t in technical_analyses]
+        fa = [as_fundamental(f) or _EMPTY_FUNDAMENTAL for f in fundamental_analyses]
+        dd = [as_delivery(d) or _EMPTY_DELIVERY for d in delivery_data]
+        
+        arrays = (
+            np.array([t.daily_vs_ema == 'ABOVE' for t in ta], dtype=np.bool_),
+            np.array([t.daily_diff_pct for t in ta], dtype=np.float64),
+            np.array([t.weekly_vs_ema == 'ABOVE' for t in ta], dtype=np.bool_),
+            np.array([t.weekly_diff_pct for t in ta], dtype=np.float64),
+            np.array([bool(d.has_qty_spike) for d in dd], dtype=np.bool_),
+            np.array([d.qty_spike_ratio for d in dd], dtype=np.float64),
+            np.array([d.latest_delivery_pct for d in dd], dtype=np.float64)
+        )
+        
+        if NUMBA_AVAILABLE:
+            # NaN inputs are scored by design, so don't warn on their comparisons
+            with np.errstate(invalid='ignore'):
+                technical = _technical_kernel(*arrays[:4])
+                delivery = _delivery_kernel(*arrays[4:])
+        else:
+            technical, delivery = self._score_arrays(*arrays)
+        fundamental = np.array([f.quality_score for f in fa], dtype=np.float64) * 2
+        
+        # Same sum order as calculate_score, accumulated into one array
+        total = technical + fundamental
+        total += delivery
+        self._cap_scores(total)
+        
+        return {
+            'total_score': total,
+            'signal': self._generate_signals_vec(total),
+            'breakdown': {
+                'technical': technical,
+                'fundamental': fundamental,
+                'delivery': delivery
+            }
+        }
+    
+    def _cap_scores(self, total: np.ndarray) -> np.ndarray:
+        """Cap total scores at min/max in place"""
+        # Same comparisons as max(min_score, min(total, max_score)), NaN included
+        total[self.max_score < total] = self.max_score
+        total[~(total > self.min_score)] = self.min_score
+        return total
+    
+    @staticmethod
+    def _score_arrays(
+        daily_above: np.ndarray,
+        daily_diff: np.ndarray,
+        weekly_above: np.ndarray,
+        weekly_diff: np.ndarray,
+        has_spike: np.ndarray,
+        spike_ratio: np.ndarray,
+        delivery_pct: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        NumPy fallback for the Numba kernels - component scores without per-stock branches
+        
+        Bands are looked up with searchsorted over the same edge tables as the
+        scalar scorers and gated with boolean masks; NaN and out-of-range
+        inputs land in the same bands as calculate_score.
+        
+        Returns:
+            Tuple of (technical scores, delivery scores)
+        """
+        bands = np.asarray(_BAND_SCORES)
+        
+        # One accumulator per component, built up in the kernel's order; each
+        # band lookup is patched with in-place masks rather than where() temporaries
+        technical = bands[np.searchsorted(_DAILY_BAND_EDGES, daily_diff)]
+        # Negative (or NaN) diffs score the "far" band; side='left' matches bisect_left
+        technical[~(daily_diff >= 0)] = bands[-1]
+        technical[~daily_above] = 0.0
+        
+        weekly = bands[np.searchsorted(_WEEKLY_BAND_EDGES, weekly_diff)]
+        weekly[~(weekly_diff >= 0)] = bands[-1]
+        np.add(technical, weekly, out=technical, where=weekly_above)
+        
+        # NaN ratios score the lowest spike band; NaN delivery % scores nothing
+        delivery = np.asarray(_SPIKE_SCORES)[np.searchsorted(_SPIKE_RATIO_EDGES, spike_ratio, side='right')]
+        delivery[np.isnan(spike_ratio)] = _SPIKE_SCORES[0]
+        delivery[~has_spike] = 0.0
+        
+        pct = np.asarray(_DELIVERY_PCT_SCORES)[np.searchsorted(_DELIVERY_PCT_EDGES, delivery_pct)]
+        pct[np.isnan(delivery_pct)] = 0.0
+        delivery += pct
+        
+        return technical, delivery
+    
+    def _calculate_technical_score(self, analysis: Optional[TechnicalAnalysis]) -> float:
         """
         Calculate technical score for EMA RETRACEMENT strategy (buy-the-dip)
         
@@ -116,44 +291,42 @@ class StockScorer:
         if not analysis:
             return 0.0
         
-        score = 0.0
-        
-        # Daily timeframe - RETRACEMENT scoring (near EMA = best)
-        daily_above = analysis.get('daily_vs_ema') == 'ABOVE'
-        daily_diff = analysis.get('daily_diff_pct', 0)
-        
-        if daily_above:
-            if 0 <= daily_diff <= 3:  # PERFECT touchpoint (0-3% above)
-                score += 2.0
-            elif 3 < daily_diff <= 5:  # Good touchpoint (3-5% above)
-                score += 1.5
-            elif 5 < daily_diff <= 8:  # Slightly extended
-                score += 1.0
-            elif 8 < daily_diff <= 15:  # Extended (not ideal entry)
-                score += 0.5
-            else:  # Far above (missed the entry)
-                score += 0.25
-        # Below EMA = downtrend, score 0
-        
-        # Weekly timeframe - RETRACEMENT scoring (long-term support)
-        weekly_above = analysis.get('weekly_vs_ema') == 'ABOVE'
-        weekly_diff = analysis.get('weekly_diff_pct', 0)
-        
-        if weekly_above:
-            if 0 <= weekly_diff <= 5:  # PERFECT long-term touchpoint
-                score += 2.0
-            elif 5 < weekly_diff <= 10:  # Good position
-                score += 1.5
-            elif 10 < weekly_diff <= 20:  # Slightly extended
-                score += 1.0
-            elif 20 < weekly_diff <= 30:  # Extended
-                score += 0.5
-            else:  # Very far (overbought)
-                score += 0.25
-        
-        return score
-    
-    def _calculate_fundamental_score(self, analysis: Optional[Dict[str, Any]]) -> float:
+        # Below EMA = downtrend, scores 0 for that timeframe
+        return self._score_technical(
+            analysis.daily_vs_ema == 'ABOVE', analysis.daily_diff_pct,
+            analysis.weekly_vs_ema == 'ABOVE', analysis.weekly_diff_pct
+        )
+    
+    @staticmethod
+    def _compile_technical() -> Callable[[bool, float, bool, float], float]:
+        """
+        Build the technical band scorer with its band tables bound as locals
+        
+        Band edges are constants, so they are captured as default arguments
+        (LOAD_FAST) and looked up with bisect instead of an if/elif ladder.
+        """
+        def score_technical(
+            daily_above: bool,
+            daily_diff: float,
+            weekly_above: bool,
+            weekly_diff: float,
+            _daily=_DAILY_BAND_EDGES,
+            _weekly=_WEEKLY_BAND_EDGES,
+            _scores=_BAND_SCORES,
+            _far=_BAND_SCORES[-1],
+            _bisect=bisect_left
+        ) -> float:
+            score = 0.0
+            # Negative (or NaN) diffs fall through to the "far" band like the original else-branch
+            if daily_above:
+                score += _scores[_bisect(_daily, daily_diff)] if 0 <= daily_diff else _far
+            if weekly_above:
+                score += _scores[_bisect(_weekly, weekly_diff)] if 0 <= weekly_diff else _far
+            return score
+        
+        return score_technical
+    
+    def _calculate_fundamental_score(self, analysis: Optional[FundamentalAnalysis]) -> float:
         """
         Calculate fundamental analysis score (-2 to +2)
         
@@ -162,12 +335,12 @@ class StockScorer:
         if not analysis:
             return 0.0
         
-        quality_score = analysis.get('quality_score', 0)
+        quality_score = analysis.quality_score
         
         # Scale quality score (-1 to +1) to (-2 to +2)
         return quality_score * 2
     
-    def _calculate_delivery_score(self, data: Optional[Dict[str, Any]]) -> float:
+    def _calculate_delivery_score(self, data: Optional[DeliveryData]) -> float:
         """
         Calculate delivery score based on QUANTITY spike (smart money detection)
         
@@ -186,29 +359,38 @@ class StockScorer:
         if not data:
             return 0.0
         
-        score = 0.0
-        
-        # QUANTITY SPIKE (This is the smart money indicator)
-        has_spike = data.get('has_qty_spike', False)
-        spike_ratio = data.get('qty_spike_ratio', 1.0)
-        
-        if has_spike:
-            if spike_ratio >= 3.0:  # 3x normal quantity = STRONG accumulation
-                score += 2.0
-            elif spike_ratio >= 2.0:  # 2x normal quantity = accumulation
-                score += 1.5
-            else:
-                score += 1.0
-        
-        # PERCENTAGE confirmation (high delivery % = real accumulation, not just trading)
-        delivery_pct = data.get('latest_delivery_pct', 0)
+        # Quantity spike is the smart money indicator; a high delivery %
+        # confirms real accumulation rather than just trading
+        return self._score_delivery(data.has_qty_spike, data.qty_spike_ratio, data.latest_delivery_pct)
+    
+    @staticmethod
+    def _compile_delivery() -> Callable[[bool, float, float], float]:
+        """
+        Build the delivery band scorer with its band tables bound as locals
         
-        if delivery_pct > 50:  # Very high delivery
-            score += 1.0
-        elif delivery_pct > 35:  # Moderate delivery
-            score += 0.5
+        Same approach as _compile_technical: bisect over constant band edges
+        instead of an if/elif ladder per stock.
+        """
+        def score_delivery(
+            has_spike: bool,
+            spike_ratio: float,
+            delivery_pct: float,
+            _spike_edges=_SPIKE_RATIO_EDGES,
+            _spike_scores=_SPIKE_SCORES,
+            _pct_edges=_DELIVERY_PCT_EDGES,
+            _pct_scores=_DELIVERY_PCT_SCORES,
+            _bisect_left=bisect_left,
+            _bisect_right=bisect_right
+        ) -> float:
+            score = 0.0
+            # NaN ratios score as the lowest spike band like the original else-branch
+            if has_spike:
+                score += _spike_scores[_bisect_right(_spike_edges, spike_ratio)] if spike_ratio == spike_ratio else _spike_scores[0]
+            # bisect_left makes the edges exclusive (> 35, > 50); NaN lands in band 0
+            score += _pct_scores[_bisect_left(_pct_edges, delivery_pct)]
+            return score
         
-        return score
+        return score_delivery
     
     def _generate_signal(self, score: float) -> str:
         """
@@ -227,20 +409,23 @@ class StockScorer:
         else:
             return 'AVOID'
     
+    def _generate_signals_vec(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Vectorized _generate_signal for an array of scores
+        
+        Args:
+            scores: Array of total scores
+        
+        Returns:
+            Array of signal strings (BUY/HOLD/AVOID)
+        """
+        # searchsorted(side='right') is digitize's bucketing minus its per-call monotonicity check
+        return self._signal_labels[np.searchsorted(self._signal_bins, scores, side='right')]
+    
     def get_signal_emoji(self, signal: str) -> str:
         """Get emoji for signal"""
-        emoji_map = {
-            'BUY': '🚀',
-            'HOLD': '⏸️',
-            'AVOID': '❌'
-        }
-        return emoji_map.get(signal, '❓')
+        return self._EMOJI_MAP.get(signal, '❓')
     
     def get_signal_color(self, signal: str) -> str:
         """Get color for signal (for dashboard)"""
-        color_map = {
-            'BUY': 'green',
-            'HOLD': 'orange',
-            'AVOID': 'red'
-        }
-        return color_map.get(signal, 'gray')
+        return self._COLOR_MAP.get(signal, 'gray')
@@ -0,0 +1,81 @@
+"""Scorer Input Types - Typed, slotted views of analyzer output"""
+
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+# dataclass(slots=...) is Python 3.10+; older interpreters get plain frozen dataclasses
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class TechnicalAnalysis:
+    """Technical fields consumed by StockScorer"""
+
+    daily_vs_ema: str = 'N/A'
+    daily_diff_pct: float = 0.0
+    weekly_vs_ema: str = 'N/A'
+    weekly_diff_pct: float = 0.0
+    timeframe_alignment: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TechnicalAnalysis':
+        """Build from a TechnicalAnalyzer.analyze() result"""
+        return cls(
+            daily_vs_ema=data.get('daily_vs_ema', 'N/A'),
+            daily_diff_pct=data.get('daily_diff_pct', 0.0),
+            weekly_vs_ema=data.get('weekly_vs_ema', 'N/A'),
+            weekly_diff_pct=data.get('weekly_diff_pct', 0.0),
+            timeframe_alignment=data.get('timeframe_alignment', 0)
+        )
+
+
+@dataclass(frozen=True, **_SLOTS)
+class FundamentalAnalysis:
+    """Fundamental fields consumed by StockScorer"""
+
+    quality_score: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FundamentalAnalysis':
+        """Build from a FundamentalAnalyzer.analyze() result"""
+        return cls(quality_score=data.get('quality_score', 0.0))
+
+
+@dataclass(frozen=True, **_SLOTS)
+class DeliveryData:
+    """Delivery fields consumed by StockScorer"""
+
+    has_qty_spike: bool = False
+    qty_spike_ratio: float = 0.0
+    latest_delivery_pct: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DeliveryData':
+        """Build from a DeliveryDataFetcher.fetch_delivery_trend() result"""
+        return cls(
+            has_qty_spike=data.get('has_qty_spike', False),
+            qty_spike_ratio=data.get('qty_spike_ratio', 0.0),
+            latest_delivery_pct=data.get('latest_delivery_pct', 0.0)
+        )
+
+
+def as_technical(data: Union[TechnicalAnalysis, Dict[str, Any], None]) -> Optional[TechnicalAnalysis]:
+    """Coerce a technical analysis dict (or None) to TechnicalAnalysis"""
+    if data is None or isinstance(data, TechnicalAnalysis):
+        return data
+    return TechnicalAnalysis.from_dict(data) if data else None
+
+
+def as_fundamental(data: Union[FundamentalAnalysis, Dict[str, Any], None]) -> Optional[FundamentalAnalysis]:
+    """Coerce a fundamental analysis dict (or None) to FundamentalAnalysis"""
+    if data is None or isinstance(data, FundamentalAnalysis):
+        return data
+    return FundamentalAnalysis.from_dict(data) if data else None
+
+
+def as_delivery(data: Union[DeliveryData, Dict[str, Any], None]) -> Optional[DeliveryData]:
+    """Coerce a delivery data dict (or None) to DeliveryData"""
+    if data is None or isinstance(data, DeliveryData):
+        return data
+    return DeliveryData.from_dict(data) if data else None
@@ -2,10 +2,15 @@
 
 import logging
 import sys
+import threading
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 from typing import Optional
 
+# Configured loggers by name - O(1) lookup, skips the handler-list probe
+_LOGGER_CACHE: dict[str, logging.Logger] = {}
+_LOGGER_LOCK = threading.Lock()
+
 
 def setup_logger(
     name: str,
@@ -29,6 +34,29 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
+    cached = _LOGGER_CACHE.get(name)
+    if cached is not None:
+        return cached
+    
+    with _LOGGER_LOCK:
+        # Another thread may have configured it while we waited
+        if name in _LOGGER_CACHE:
+            return _LOGGER_CACHE[name]
+        
+        logger = _configure_logger(name, log_file, level, max_bytes, backup_count, console_output)
+        _LOGGER_CACHE[name] = logger
+        return logger
+
+
+def _configure_logger(
+    name: str,
+    log_file: Optional[str],
+    level: str,
+    max_bytes: int,
+    backup_count: int,
+    console_output: bool
+) -> logging.Logger:
+    """Attach handlers to a logger (caller holds _LOGGER_LOCK)"""
     logger = logging.getLogger(name)
     
     # Avoid duplicate handlers
@@ -79,6 +107,10 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
+    cached = _LOGGER_CACHE.get(name)
+    if cached is not None:
+        return cached
+    
     logger = logging.getLogger(name)
     
     # If logger doesn't have handlers, set it up with defaults
@@ -89,6 +121,7 @@ def get_logger(name: str) -> logging.Logger:
             level="INFO"
         )
     
+    _LOGGER_CACHE[name] = logger
     return logger
 
 
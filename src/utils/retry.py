@@ -2,7 +2,7 @@
 
 import time
 import functools
-from typing import Callable, Any, Type, Tuple
+from typing import Callable, Any, Type, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,7 +13,7 @@ def retry_with_backoff(
     base_delay: float = 2.0,
     max_delay: float = 60.0,
     exponential: bool = True,
-    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = (OSError,),
     on_retry: Callable[[Exception, int], None] = None
 ):
     """
@@ -24,22 +24,37 @@ def retry_with_backoff(
         base_delay: Initial delay between retries in seconds
         max_delay: Maximum delay between retries
         exponential: Use exponential backoff if True, constant delay if False
-        exceptions: Tuple of exception types to catch and retry
+        exceptions: Exception type, or tuple of types, to catch and retry.
+            Defaults to OSError, which covers I/O, timeout and connection
+            errors (requests exceptions are IOError/OSError subclasses);
+            other errors such as logic bugs are raised immediately instead
+            of being retried. Pass Exception to retry everything as before.
         on_retry: Optional callback function called on each retry
     
     Returns:
-        Decorated function
+        Decorated function (its retry delay schedule is exposed as `.delays`)
     """
+    # Delay schedule is fixed at decoration time: delays[i] follows failed attempt i+1
+    delays = tuple(
+        min(base_delay * (2 ** i if exponential else 1), max_delay)
+        for i in range(max_attempts - 1)
+    )
+    
+    # A single exception class matches faster than a tuple in the except clause
+    if isinstance(exceptions, type):
+        catch = exceptions
+    else:
+        catch = exceptions[0] if len(exceptions) == 1 else tuple(exceptions)
+    
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             attempt = 0
-            delay = base_delay
             
             while attempt < max_attempts:
                 try:
                     return func(*args, **kwargs)
-                except exceptions as e:
+                except catch as e:
                     attempt += 1
                     
                     if attempt >= max_attempts:
@@ -52,22 +67,18 @@ def retry_with_backoff(
                     if on_retry:
                         on_retry(e, attempt)
                     
+                    delay = delays[attempt - 1]
                     logger.warning(
                         f"{func.__name__} attempt {attempt} failed: {str(e)}. "
                         f"Retrying in {delay:.2f}s..."
                     )
                     
                     time.sleep(delay)
-                    
-                    # Calculate next delay
-                    if exponential:
-                        delay = min(delay * 2, max_delay)
-                    else:
-                        delay = base_delay
             
             # This should never be reached, but just in case
             raise RuntimeError(f"{func.__name__} exceeded maximum retry attempts")
         
+        wrapper.delays = delays
         return wrapper
     return decorator
 
@@ -1,10 +1,22 @@
 """Validation utility functions"""
 
 import re
+import string
+import functools
 from datetime import datetime
 from typing import Optional
 
+# NSE symbols are typically uppercase letters, may include numbers and hyphens
+# Examples: RELIANCE, TCS, M&M, NIFTY50
+_SYMBOL_RE = re.compile(r'^[A-Z0-9&\-]+$')
+_SANITIZE_RE = re.compile(r'[^A-Z0-9&\-]')
 
+# str.translate table deleting every ASCII character outside [A-Z0-9&-]
+_KEEP = set(string.ascii_uppercase + string.digits + '&-')
+_DELETE_TABLE = dict.fromkeys(i for i in range(128) if chr(i) not in _KEEP)
+
+
+@functools.lru_cache(maxsize=4096)
 def validate_symbol(symbol: str) -> bool:
     """
     Validate stock symbol format
@@ -18,17 +30,14 @@ def validate_symbol(symbol: str) -> bool:
     if not symbol:
         return False
     
-    # NSE symbols are typically uppercase letters, may include numbers and hyphens
-    # Examples: RELIANCE, TCS, M&M, NIFTY50
-    pattern = r'^[A-Z0-9&\-]+$'
-    
     # Length should be reasonable (2-20 characters)
     if len(symbol) < 2 or len(symbol) > 20:
         return False
     
-    return bool(re.match(pattern, symbol.upper()))
+    return bool(_SYMBOL_RE.match(symbol.upper()))
 
 
+@functools.lru_cache(maxsize=1024)
 def validate_date(date_str: str, format: str = "%Y-%m-%d") -> bool:
     """
     Validate date string format
@@ -41,6 +50,11 @@ def validate_date(date_str: str, format: str = "%Y-%m-%d") -> bool:
         True if valid, False otherwise
     """
     try:
+        # Fast path: fromisoformat is C-implemented, strptime parses the format each call
+        if format == "%Y-%m-%d" and len(date_str) == 10 and date_str[4] == date_str[7] == '-':
+            datetime.fromisoformat(date_str)
+            return True
+        
         datetime.strptime(date_str, format)
         return True
     except (ValueError, TypeError):
@@ -85,6 +99,7 @@ def validate_percentage(value: float, allow_negative: bool = False) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_symbol(symbol: str) -> Optional[str]:
     """
     Sanitize and normalize stock symbol
@@ -101,8 +116,10 @@ def sanitize_symbol(symbol: str) -> Optional[str]:
     # Convert to uppercase and strip whitespace
     clean_symbol = symbol.strip().upper()
     
-    # Remove invalid characters
-    clean_symbol = re.sub(r'[^A-Z0-9&\-]', '', clean_symbol)
+    # Remove invalid characters (translate covers ASCII; regex handles the rare non-ASCII input)
+    clean_symbol = clean_symbol.translate(_DELETE_TABLE)
+    if not clean_symbol.isascii():
+        clean_symbol = _SANITIZE_RE.sub('', clean_symbol)
     
     if validate_symbol(clean_symbol):
         return clean_symbol
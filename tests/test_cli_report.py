@@ -0,0 +1,56 @@
+"""Single-stock CLI report tests"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from cli_async import REPORT_SECTIONS
+from src.async_pipeline import AsyncStockDataPipeline
+
+
+FUNDAMENTALS = {
+    'company_name': 'Tata Consultancy Services', 'sector': 'IT', 'market_cap': 1.2e5,
+    'pe_ratio': 28.4, 'roe': 45.1, 'debt_to_equity': 0.1
+}
+
+DELIVERY = {
+    'latest_delivery_qty': 1000, 'avg_delivery_qty': 800, 'baseline_delivery_qty': 700,
+    'qty_spike_ratio': 1.4, 'has_qty_spike': False, 'latest_delivery_pct': 59.53,
+    'qty_trend': 'rising', 'lookback_days': 90, 'data_points': 60
+}
+
+
+class TestReportSections(unittest.TestCase):
+    """Every REPORT_SECTIONS row reads a key the pipeline actually produces"""
+
+    def test_sections_format_pipeline_result(self):
+        closes = 100 + np.random.default_rng(1).standard_normal(1500).cumsum()
+        price_data = pd.DataFrame({
+            'date': pd.date_range('2018-01-01', periods=1500, freq='B'),
+            'close': closes
+        })
+
+        pipeline = AsyncStockDataPipeline(max_workers=1, use_delivery=False)
+        try:
+            with mock.patch.object(
+                pipeline.async_yf_fetcher, 'fetch_fundamentals',
+                mock.AsyncMock(return_value=FUNDAMENTALS)
+            ):
+                result = asyncio.run(pipeline._analyze_stock_async(
+                    'TCS', price_data=price_data, delivery=DELIVERY
+                ))
+        finally:
+            pipeline.close()
+
+        self.assertIsNotNone(result)
+        for title, rows in REPORT_SECTIONS:
+            for label, fmt in rows:
+                with self.subTest(section=title, row=label):
+                    self.assertIsInstance(fmt(result), str)
+
+
+if __name__ == '__main__':
+    unittest.main()
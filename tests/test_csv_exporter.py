@@ -0,0 +1,62 @@
+"""CSV exporter tests"""
+
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.async_pipeline import _results_to_df
+from src.exporters import CSVExporter
+
+
+def _results_with_raw_data() -> pd.DataFrame:
+    """Pipeline-shaped results where only some rows carry raw_data (save_steps=True)"""
+    rows = [
+        {
+            'Symbol': 'TCS', 'Company': 'Tata, "Consultancy"', 'Sector': 'IT',
+            'Price': 3500.5, 'Has_Qty_Spike': True, 'Score': 3.456, 'Signal': 'BUY',
+            'raw_data': {'Symbol': 'TCS', 'Delivery_Qty': 1000, 'Qty_Trend': 'rising'}
+        },
+        {
+            'Symbol': 'INFY', 'Company': 'Infosys', 'Sector': 'IT',
+            'Price': 1500.0, 'Has_Qty_Spike': False, 'Score': 1.2, 'Signal': 'HOLD'
+        }
+    ]
+    return _results_to_df(rows)
+
+
+class TestCSVExporter(unittest.TestCase):
+    """CSVExporter writes every results frame the pipeline can produce"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.exporter = CSVExporter(output_dir=self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_export_results_with_raw_data(self):
+        df = _results_with_raw_data()
+        path = self.exporter.export(df, filename='results.csv')
+
+        back = pd.read_csv(path)
+        self.assertEqual(list(back.columns), list(df.columns))
+        self.assertEqual(back['Symbol'].tolist(), ['TCS', 'INFY'])
+        self.assertEqual(back['Company'].tolist(), ['Tata, "Consultancy"', 'Infosys'])
+
+    def test_export_with_metadata_and_raw_data(self):
+        df = _results_with_raw_data()
+        path = self.exporter.export_with_metadata(df, {'run': 1}, filename='meta.csv')
+
+        back = pd.read_csv(path, comment='#')
+        self.assertEqual(back['Symbol'].tolist(), ['TCS', 'INFY'])
+
+    def test_export_format_matches_to_csv(self):
+        # Same bytes with or without the raw_data column: True/False, 10.0, minimal quoting
+        for df in (_results_with_raw_data(), _results_with_raw_data().drop(columns='raw_data')):
+            path = self.exporter.export(df, filename='plain.csv')
+            with open(path) as f:
+                self.assertEqual(f.read(), df.to_csv(index=False))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""StockScorer batch-path tests"""
+
+import math
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import src.scorers.stock_scorer as stock_scorer
+from src.scorers import StockScorer
+
+NAN = float('nan')
+
+
+def _analyses(seed: int, n: int = 2000):
+    """Random analyzer outputs, including missing analyses, band edges and NaNs"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for _ in range(n):
+        technical = None if rng.random() < 0.1 else {
+            'daily_vs_ema': rng.choice(['ABOVE', 'BELOW']),
+            'daily_diff_pct': rng.choice([rng.uniform(-5, 40), 0.0, 3.0, 15.0, NAN]),
+            'weekly_vs_ema': rng.choice(['ABOVE', 'BELOW']),
+            'weekly_diff_pct': rng.choice([rng.uniform(-5, 40), 5.0, 30.0, NAN])
+        }
+        fundamental = None if rng.random() < 0.2 else {'quality_score': rng.uniform(-1, 1)}
+        delivery = None if rng.random() < 0.3 else {
+            'has_qty_spike': bool(rng.random() < 0.5),
+            'qty_spike_ratio': rng.choice([rng.uniform(0, 5), 2.0, 3.0, NAN]),
+            'latest_delivery_pct': rng.choice([rng.uniform(0, 90), 35.0, 50.0, NAN])
+        }
+        rows.append((technical, fundamental, delivery))
+    return rows
+
+
+class TestScoreBatch(unittest.TestCase):
+    """score_batch must agree with per-stock calculate_score"""
+
+    def setUp(self):
+        self.scorer = StockScorer()
+
+    def assertMatchesCalculateScore(self, rows):
+        batch = self.scorer.score_batch(*zip(*rows))
+        for i, row in enumerate(rows):
+            expected = self.scorer.calculate_score(*row)
+            self.assertEqual(batch['total_score'][i], expected['total_score'])
+            self.assertEqual(batch['signal'][i], expected['signal'])
+            for key in ('technical', 'fundamental', 'delivery'):
+                actual = batch['breakdown'][key][i]
+                self.assertTrue(
+                    actual == expected['breakdown'][key] or (math.isnan(actual) and math.isnan(expected['breakdown'][key])),
+                    (key, row)
+                )
+
+    def test_matches_calculate_score(self):
+        self.assertMatchesCalculateScore(_analyses(1))
+
+    def test_matches_calculate_score_without_numba(self):
+        with mock.patch.object(stock_scorer, 'NUMBA_AVAILABLE', False):
+            self.assertMatchesCalculateScore(_analyses(2))
+
+    def test_caps_and_empty_batch(self):
+        rows = [({'daily_vs_ema': 'ABOVE', 'daily_diff_pct': 1.0, 'weekly_vs_ema': 'ABOVE', 'weekly_diff_pct': 1.0},
+                 {'quality_score': q}, None) for q in (5.0, -5.0, NAN)]
+        self.assertMatchesCalculateScore(rows)
+        self.assertEqual(len(self.scorer.score_batch([], [], [])['total_score']), 0)
+
+
+class TestSignalBuckets(unittest.TestCase):
+    """Vectorized signal bucketing must agree with _generate_signal"""
+
+    def test_signal_determination(self):
+        scorer = StockScorer()
+        scores = np.array([-5.0, 0.0, 0.99, 1.0, 2.0, 2.95, 2.99, 3.0, 5.0])
+        expected = ['AVOID', 'AVOID', 'AVOID', 'HOLD', 'HOLD', 'HOLD', 'HOLD', 'BUY', 'BUY']
+
+        self.assertEqual(scorer._generate_signals_vec(scores).tolist(), expected)
+        self.assertEqual([scorer._generate_signal(score) for score in scores], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
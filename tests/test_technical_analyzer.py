@@ -0,0 +1,47 @@
+"""TechnicalAnalyzer batch-path tests"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.analyzers import TechnicalAnalyzer
+
+
+def _history(seed: int, bars: int = 1500) -> pd.DataFrame:
+    """Daily price history shaped like the yfinance fetcher's output"""
+    closes = 100 + np.random.default_rng(seed).standard_normal(bars).cumsum()
+    return pd.DataFrame({
+        'date': pd.date_range('2018-01-01', periods=bars, freq='B'),
+        'close': closes
+    })
+
+
+class TestAnalyzeBatch(unittest.TestCase):
+    """analyze_batch must agree with per-symbol analyze()"""
+
+    def setUp(self):
+        self.analyzer = TechnicalAnalyzer()
+
+    def test_one_symbol_batch(self):
+        # A one-column panel is both C- and F-contiguous
+        data = _history(1)
+        result = self.analyzer.analyze_batch({'A': data})
+        self.assertIsNotNone(result['A'])
+        self.assertEqual(result['A'], self.analyzer.analyze(data))
+
+    def test_one_bar_batch(self):
+        histories = {'A': _history(1, bars=1), 'B': _history(2, bars=1)}
+        result = self.analyzer.analyze_batch(histories)
+        for symbol, data in histories.items():
+            self.assertEqual(result[symbol], self.analyzer.analyze(data))
+
+    def test_mixed_length_batch(self):
+        histories = {'A': _history(1), 'B': _history(2, bars=300), 'C': _history(3, bars=40)}
+        result = self.analyzer.analyze_batch(histories)
+        for symbol, data in histories.items():
+            self.assertEqual(result[symbol], self.analyzer.analyze(data))
+
+
+if __name__ == '__main__':
+    unittest.main()